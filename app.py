@@ -1,7 +1,7 @@
 import os
 import sys
 import logging
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -17,113 +17,191 @@ from routes.treasurer import treasurer_bp
 from routes.savings import savings_bp
 from routes.loans import loans_bp
 from routes.season import season_bp
-from db import close_db
-from scheduler import start_scheduler
+from routes.jobs import jobs_bp
+from db import (
+    close_db, pool_metrics, record_pool_rejection, PoolTimeout, DB_POOL_RETRY_AFTER
+)
+from utils.token import role_required
+from scheduler import start_scheduler, job_metrics
+from services.http_client import http_metrics
 
 load_dotenv()
 
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
-
-# ------------------------------
-# CORS Configuration -- origins come from .env, not hardcoded, so the
-# same code deploys to any environment (dev/staging/prod) without edits.
-# ------------------------------
-FRONTEND_ORIGINS = [
-    o.strip() for o in os.environ.get("FRONTEND_ORIGINS", "").split(",") if o.strip()
-]
-if not FRONTEND_ORIGINS:
-    raise RuntimeError("FRONTEND_ORIGINS is not set in .env (comma-separated list)")
-
-CORS(
-    app,
-    origins=FRONTEND_ORIGINS,
-    supports_credentials=True,
-    allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
-    methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
-)
-
 
-@app.before_request
-def handle_preflight():
-    if request.method == "OPTIONS":
-        response = jsonify()
-        origin = request.headers.get('Origin')
-        if origin in FRONTEND_ORIGINS:
-            response.headers.add('Access-Control-Allow-Origin', origin)
-        response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Requested-With')
-        response.headers.add('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, DELETE, OPTIONS')
-        response.headers.add('Access-Control-Allow-Credentials', 'true')
+def create_app(run_scheduler=False):
+    """
+    Build the Flask app. Safe to call before a fork: it opens no database
+    connections (db.py creates each process's pool on first use) and, by
+    default, starts no background jobs -- otherwise every worker of a
+    pre-forking server would run its own copy of every scheduled job.
+    Exactly one process should pass run_scheduler=True (see __main__).
+    """
+    app = Flask(__name__)
+
+    # ------------------------------
+    # CORS Configuration -- origins come from .env, not hardcoded, so the
+    # same code deploys to any environment (dev/staging/prod) without edits.
+    # ------------------------------
+    frontend_origins = [
+        o.strip() for o in os.environ.get("FRONTEND_ORIGINS", "").split(",") if o.strip()
+    ]
+    if not frontend_origins:
+        raise RuntimeError("FRONTEND_ORIGINS is not set in .env (comma-separated list)")
+    app.config["FRONTEND_ORIGINS"] = frontend_origins
+
+    CORS(
+        app,
+        origins=frontend_origins,
+        supports_credentials=True,
+        allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
+        methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    )
+
+    @app.before_request
+    def handle_preflight():
+        if request.method == "OPTIONS":
+            response = jsonify()
+            origin = request.headers.get('Origin')
+            if origin in frontend_origins:
+                response.headers.add('Access-Control-Allow-Origin', origin)
+            response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Requested-With')
+            response.headers.add('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, DELETE, OPTIONS')
+            response.headers.add('Access-Control-Allow-Credentials', 'true')
+            return response
+
+    # ------------------------------
+    # Health Check Endpoints
+    # ------------------------------
+    @app.route("/ping")
+    def ping():
+        return jsonify({"status": "alive", "message": "Server is up!"})
+
+    @app.route("/api/health")
+    def health_check():
+        return jsonify({
+            "status": "healthy",
+            "cors_enabled": True
+        })
+
+    # Live connection-pool usage (in use / idle / waiters / checkout latency
+    # / hold times) -- what DB_POOL_MAX should be sized from. Per process:
+    # with N workers, each answers for its own pool.
+    @app.route("/api/health/db-pool")
+    @role_required("admin")
+    def db_pool_health():
+        return jsonify(pool_metrics())
+
+    # Scheduled-job run-lock outcomes for this process: how often each job
+    # ran vs. was skipped because another process held its lock.
+    @app.route("/api/health/jobs")
+    @role_required("admin")
+    def jobs_health():
+        return jsonify(job_metrics())
+
+    # Outbound BBC API calls from this process: latency, retries and
+    # circuit-breaker state per host (see services/http_client.py).
+    @app.route("/api/health/http")
+    @role_required("admin")
+    def http_health():
+        return jsonify(http_metrics())
+
+    @app.route("/")
+    def home():
+        return jsonify({
+            "message": "Football Ladder API",
+            "version": "2.0.0"
+        })
+
+    # ------------------------------
+    # Blueprints Registration
+    # ------------------------------
+    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")
+    app.register_blueprint(fixtures_bp, url_prefix="/api/fixtures")
+    app.register_blueprint(predictions_bp, url_prefix="/api/predictions")
+    app.register_blueprint(leaderboard_bp, url_prefix="/api/leaderboard")
+    app.register_blueprint(results_bp, url_prefix="/api/results")
+    app.register_blueprint(treasurer_bp, url_prefix="/api/treasurer")
+    app.register_blueprint(savings_bp, url_prefix="/api/savings")
+    app.register_blueprint(loans_bp, url_prefix="/api/loans")
+    app.register_blueprint(season_bp, url_prefix="/api/season")
+    app.register_blueprint(jobs_bp, url_prefix="/api/jobs")
+
+    @app.errorhandler(404)
+    def not_found(error):
+        logger.warning("404: %s %s", request.method, request.path)
+        return jsonify({"error": "Endpoint not found", "status": 404}), 404
+
+    @app.errorhandler(500)
+    def internal_error(error):
+        return jsonify({"error": "Internal server error", "status": 500}), 500
+
+    # ------------------------------
+    # Pool back-pressure -- when every DB_POOL_MAX connection is busy past
+    # DB_POOL_TIMEOUT (pre-deadline rush), answer a fast 503 + Retry-After so
+    # the frontend backs off, instead of a generic 500.
+    # ------------------------------
+    @app.errorhandler(PoolTimeout)
+    def pool_exhausted(error):
+        logger.warning("DB pool exhausted: %s %s", request.method, request.path)
+        g.db_pool_exhausted_handled = True
+        return _pool_exhausted_response()
+
+    @app.after_request
+    def pool_exhausted_fallback(response):
+        # Most routes wrap their service call in `except Exception` and return
+        # their own 500, so PoolTimeout never reaches the handler above.
+        # get_db() flags the failure on g; turn that 500 into the 503 here.
+        if (g.get("db_pool_exhausted") and not g.get("db_pool_exhausted_handled")
+                and response.status_code >= 500):
+            logger.warning("DB pool exhausted: %s %s", request.method, request.path)
+            return _pool_exhausted_response()
         return response
 
+    @app.teardown_appcontext
+    def teardown_db(exception):
+        close_db()
 
-# ------------------------------
-# Health Check Endpoints
-# ------------------------------
-@app.route("/ping")
-def ping():
-    return jsonify({"status": "alive", "message": "Server is up!"})
+    # ------------------------------
+    # Scheduler -- jobs run in-process inside an app context (see scheduler.py)
+    # ------------------------------
+    if run_scheduler:
+        start_scheduler(app)
 
-
-@app.route("/api/health")
-def health_check():
-    return jsonify({
-        "status": "healthy",
-        "cors_enabled": True
-    })
+    return app
 
 
-@app.route("/")
-def home():
-    return jsonify({
-        "message": "Football Ladder API",
-        "version": "2.0.0"
+def _pool_exhausted_response():
+    record_pool_rejection()
+    response = jsonify({
+        "error": "Server busy, please retry shortly",
+        "status": 503,
     })
+    response.status_code = 503
+    response.headers["Retry-After"] = str(DB_POOL_RETRY_AFTER)
+    return response
 
 
-# ------------------------------
-# Blueprints Registration
-# ------------------------------
-app.register_blueprint(auth_bp, url_prefix="/api/auth")
-app.register_blueprint(admin_bp, url_prefix="/api/admin")
-app.register_blueprint(fixtures_bp, url_prefix="/api/fixtures")
-app.register_blueprint(predictions_bp, url_prefix="/api/predictions")
-app.register_blueprint(leaderboard_bp, url_prefix="/api/leaderboard")
-app.register_blueprint(results_bp, url_prefix="/api/results")
-app.register_blueprint(treasurer_bp, url_prefix="/api/treasurer")
-app.register_blueprint(savings_bp, url_prefix="/api/savings")
-app.register_blueprint(loans_bp, url_prefix="/api/loans")
-app.register_blueprint(season_bp, url_prefix="/api/season")
-
-# ------------------------------
-# Scheduler -- jobs run in-process inside an app context (see scheduler.py)
-# ------------------------------
-start_scheduler(app)
-
-
-@app.errorhandler(404)
-def not_found(error):
-    logger.warning("404: %s %s", request.method, request.path)
-    return jsonify({"error": "Endpoint not found", "status": 404}), 404
-
-
-@app.errorhandler(500)
-def internal_error(error):
-    return jsonify({"error": "Internal server error", "status": 500}), 500
-
-
-@app.teardown_appcontext
-def teardown_db(exception):
-    close_db()
+# WSGI entry for multi-process servers, e.g. `gunicorn -w 4 app:app`
+# (with or without --preload): no pool and no scheduler until needed.
+app = create_app()
 
 
 if __name__ == "__main__":
+    # Single-process waitress deployment: this process is the designated
+    # one, so the background jobs run here -- unless they've been moved to
+    # the standalone worker (`python -m worker`).
     from waitress import serve
     port = int(os.environ.get("PORT", 5000))
 
+    if os.getenv("RUN_SCHEDULER_IN_PROCESS", "1") == "1":
+        start_scheduler(app)
+    else:
+        logger.info("In-process scheduler disabled (RUN_SCHEDULER_IN_PROCESS=0)")
     logger.info("Server starting")
-    logger.info("Allowed origins: %s", FRONTEND_ORIGINS)
+    logger.info("Allowed origins: %s", app.config["FRONTEND_ORIGINS"])
 
     serve(app, host="0.0.0.0", port=port)
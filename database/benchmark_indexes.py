@@ -0,0 +1,138 @@
+"""
+Before/after benchmark for the hot-path index pack (see
+create_hot_path_indexes in init_db.py).
+
+Runs the per-request queries from services/savings.py, services/loans.py
+and services/predictions.py that the new indexes target, against real
+data, and prints for each: the plan's scan type and the median/p95
+execution time over a number of runs (EXPLAIN ANALYZE timing, so network
+latency to the pooler doesn't drown out the difference).
+
+Usage:
+    python database/benchmark_indexes.py > before.txt
+    python database/init_db.py --indexes-only
+    python database/benchmark_indexes.py > after.txt
+
+Read-only: every statement runs in a transaction that is rolled back.
+"""
+import json
+import os
+import statistics
+import sys
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+RUNS = int(os.getenv("BENCH_RUNS", "25"))
+
+# Sample ids are picked from the data itself so the benchmark measures a
+# realistic row, not an id that doesn't exist.
+SAMPLES = {
+    "user_id": "SELECT user_id FROM savings_transactions GROUP BY user_id ORDER BY COUNT(*) DESC LIMIT 1",
+    "surcharge_id": "SELECT id FROM surcharge_ledger ORDER BY id DESC LIMIT 1",
+    "loan_id": "SELECT id FROM loans ORDER BY id DESC LIMIT 1",
+    "fixture_id": "SELECT fixture_id FROM fixtures ORDER BY fixture_id DESC LIMIT 1",
+    "matchday": "SELECT MAX(matchday) FROM fixtures",
+}
+
+# (label, SQL, sample keys it takes in order)
+QUERIES = [
+    ("savings: confirmed balance per user",
+     "SELECT COALESCE(SUM(allocated_savings), 0) FROM savings_transactions "
+     "WHERE user_id = %s AND status = 'confirmed'",
+     ("user_id",)),
+    ("savings: surcharge cleared per surcharge",
+     "SELECT COALESCE(SUM(amount), 0) FROM surcharge_clearances WHERE surcharge_id = %s",
+     ("surcharge_id",)),
+    ("loans: endorsement count",
+     "SELECT COUNT(*) FROM loan_endorsements WHERE loan_id = %s",
+     ("loan_id",)),
+    ("loans: confirmed repayments per loan",
+     "SELECT COALESCE(SUM(amount), 0) FROM loan_repayments "
+     "WHERE loan_id = %s AND status = 'confirmed'",
+     ("loan_id",)),
+    ("predictions: predictions for a fixture",
+     "SELECT id, predicted_result FROM predictions WHERE fixture_id = %s",
+     ("fixture_id",)),
+    ("predictions: fixtures in a matchday",
+     "SELECT fixture_id, kickoff_time FROM fixtures WHERE matchday = %s",
+     ("matchday",)),
+    ("predictions: matchday recompute join",
+     "SELECT p.user_id, SUM(COALESCE(p.points_awarded, 0)) FROM predictions p "
+     "JOIN fixtures f ON p.fixture_id = f.fixture_id WHERE f.matchday = %s GROUP BY p.user_id",
+     ("matchday",)),
+    ("collect_results: pending fixtures",
+     "SELECT fixture_id FROM fixtures WHERE result IS NULL "
+     "AND kickoff_time <= NOW() - interval '2 hours 15 minutes' ORDER BY kickoff_time",
+     ()),
+    ("audit: newest admin actions",
+     "SELECT id FROM audit_log ORDER BY created_at DESC LIMIT 200",
+     ()),
+]
+
+
+def _scan_types(plan):
+    """Every scan node type in the plan, e.g. ['Index Scan', 'Seq Scan']."""
+    found = []
+    if "Scan" in plan.get("Node Type", ""):
+        found.append(plan["Node Type"])
+    for child in plan.get("Plans", []):
+        found.extend(_scan_types(child))
+    return found
+
+
+def main():
+    conn = psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        port=os.getenv("DB_PORT"),
+        dbname=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+    )
+    cur = conn.cursor()
+
+    samples = {}
+    for key, sql in SAMPLES.items():
+        try:
+            cur.execute(sql)
+            row = cur.fetchone()
+            samples[key] = row[0] if row else None
+        except psycopg2.Error:
+            conn.rollback()
+            samples[key] = None
+
+    print(f"{'query':45} {'scan':36} {'median ms':>10} {'p95 ms':>10}")
+    for label, sql, keys in QUERIES:
+        params = tuple(samples.get(k) for k in keys)
+        if any(p is None for p in params):
+            print(f"{label:45} {'(no sample data)':36}")
+            continue
+
+        timings = []
+        scans = []
+        try:
+            for _ in range(RUNS):
+                cur.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params)
+                plan = cur.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                timings.append(plan[0]["Execution Time"])
+                scans = _scan_types(plan[0]["Plan"])
+        except psycopg2.Error as e:
+            print(f"{label:45} error: {e.pgerror or e}".rstrip())
+            continue
+        finally:
+            conn.rollback()
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{label:45} {', '.join(sorted(set(scans))):36} "
+              f"{statistics.median(timings):10.3f} {p95:10.3f}")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
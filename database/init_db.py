@@ -1,5 +1,6 @@
 import psycopg2
 import os
+import sys
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 
@@ -43,7 +44,7 @@ def init_db():
             matchday INTEGER NOT NULL,
             home_team TEXT NOT NULL,
             away_team TEXT NOT NULL,
-            kickoff_time TEXT NOT NULL,
+            kickoff_time TIMESTAMPTZ NOT NULL,
             result TEXT DEFAULT NULL
         )
     ''')
@@ -88,6 +89,28 @@ def init_db():
         END $$;
     ''')
 
+    # MIGRATION: kickoff_time used to be TEXT (ISO-8601 strings, always
+    # UTC with an offset). That forced a ::timestamptz cast on every row
+    # of the pending-results scan, made MAX(kickoff_time) a string
+    # comparison, and had Python re-parsing it everywhere. Convert once
+    # in place, then index it so the pending scan and the per-matchday
+    # first-kickoff lookup are index range reads.
+    cursor.execute('''
+        DO $$
+        BEGIN
+            IF (
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'fixtures' AND column_name = 'kickoff_time'
+            ) = 'text' THEN
+                ALTER TABLE fixtures
+                ALTER COLUMN kickoff_time TYPE TIMESTAMPTZ USING kickoff_time::timestamptz;
+            END IF;
+        END $$;
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_fixtures_kickoff_time ON fixtures (kickoff_time)
+    ''')
+
     # MATCHDAY TRACKER TABLE
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS matchday_tracker (
@@ -138,6 +161,18 @@ def init_db():
         )
     ''')
 
+    # LEADERBOARD SNAPSHOT -- singleton row holding the pre-serialized
+    # GET /api/leaderboard response; version doubles as the ETag. See
+    # services/leaderboard.py.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS leaderboard_snapshot (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version BIGINT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    ''')
+
     # MIGRATION: add is_treasurer to pre-existing users tables that were
     # created before this column existed (CREATE TABLE IF NOT EXISTS above
     # won't add it to an already-existing table).
@@ -355,9 +390,153 @@ def init_db():
         )
     ''')
 
+    # Per-cache version counters: writers bump them so every app/worker
+    # process drops its in-process cache copy (services/cache_versions.py).
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cache_versions (
+            name TEXT PRIMARY KEY,
+            version BIGINT NOT NULL
+        )
+    ''')
+
+    # ------------------------------------------------------------------
+    # Background job queue -- admin-triggered scoring work is enqueued
+    # here and drained by the scheduler/worker processes with
+    # FOR UPDATE SKIP LOCKED (see services/jobs.py), instead of running
+    # inside the HTTP request.
+    # ------------------------------------------------------------------
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id BIGSERIAL PRIMARY KEY,
+            kind TEXT NOT NULL,
+            payload TEXT,
+            status TEXT NOT NULL DEFAULT 'queued'
+                CHECK (status IN ('queued', 'running', 'done', 'failed')),
+            result TEXT,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created_by INTEGER REFERENCES users(id) ON DELETE SET NULL,
+            locked_by TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            started_at TIMESTAMPTZ,
+            finished_at TIMESTAMPTZ
+        )
+    ''')
+    # Partial: the queue scan only ever looks at unfinished jobs, which
+    # stay a handful of rows however long the history grows.
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_jobs_unfinished
+        ON jobs (status, id) WHERE status IN ('queued', 'running')
+    ''')
+
+    # One row per scheduled job: which process holds the run lease and
+    # until when, and the last schedule tick that was claimed -- so each
+    # tick runs once however many app/worker processes fire it (see
+    # claim_job_lease in services/jobs.py).
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_leases (
+            job TEXT PRIMARY KEY,
+            holder TEXT,
+            lease_until TIMESTAMPTZ NOT NULL,
+            last_tick TIMESTAMPTZ
+        )
+    ''')
+
     conn.commit()
     conn.close()
 
+
+# Hot-path indexes: (name, table, definition). Each covers a predicate
+# the services hit on every request/job run that previously had nothing
+# but a PK/unique to fall back on -- i.e. a sequential scan. Only indexes
+# that database/benchmark_indexes.py showed turning that scan into an
+# index scan on season-sized data are listed; an index the planner never
+# picks is pure write overhead.
+HOT_PATH_INDEXES = [
+    # submit validation / matchday lock cache / every per-matchday read
+    ("idx_fixtures_matchday", "fixtures", "(matchday)"),
+    # scoring, final_result stamping, per-fixture prediction reads
+    ("idx_predictions_fixture_id", "predictions", "(fixture_id)"),
+    # savings balances / weekly totals
+    ("idx_savings_transactions_user_status", "savings_transactions", "(user_id, status)"),
+    # outstanding-balance sums per loan
+    ("idx_loan_repayments_loan_status", "loan_repayments", "(loan_id, status)"),
+    # admin audit log, newest first
+    ("idx_audit_log_created_at", "audit_log", "(created_at)"),
+]
+
+# Indexes an earlier version of HOT_PATH_INDEXES built that the benchmark
+# showed the planner never uses (the pending-results scan already has
+# idx_fixtures_kickoff_time; clearances and endorsements are a few
+# hundred rows a season). Dropped so deployments that built them stop
+# paying for them on every write.
+DROPPED_HOT_PATH_INDEXES = [
+    "idx_fixtures_pending_kickoff",
+    "idx_surcharge_clearances_surcharge_id",
+    "idx_loan_endorsements_loan_id",
+]
+
+
+def create_hot_path_indexes():
+    """
+    Online index migration -- safe to run against the live database.
+
+    CREATE INDEX CONCURRENTLY doesn't block writes while it builds, at the
+    cost of not being allowed inside a transaction block, so this runs on
+    its own autocommit connection rather than as part of init_db()'s
+    single transaction. A concurrent build that fails (or is interrupted)
+    leaves an INVALID index behind that IF NOT EXISTS would happily skip
+    forever; those are dropped and rebuilt here. Tables that don't exist
+    yet in this deployment are skipped, not created. Indexes retired to
+    DROPPED_HOT_PATH_INDEXES are dropped, also concurrently.
+    """
+    conn = psycopg2.connect(
+        host=DB_HOST,
+        port=DB_PORT,
+        dbname=DB_NAME,
+        user=DB_USER,
+        password=DB_PASSWORD
+    )
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    for name, table, definition in HOT_PATH_INDEXES:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+        if not cursor.fetchone()[0]:
+            print(f"Skipping {name}: table {table} does not exist")
+            continue
+
+        cursor.execute('''
+            SELECT i.indisvalid
+            FROM pg_class c
+            JOIN pg_index i ON i.indexrelid = c.oid
+            WHERE c.relname = %s
+        ''', (name,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            continue
+        if row and not row[0]:
+            print(f"Dropping invalid leftover index {name}")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+        print(f"Creating {name} on {table} {definition}")
+        cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+    for name in DROPPED_HOT_PATH_INDEXES:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+        if cursor.fetchone()[0]:
+            print(f"Dropping unused index {name}")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    conn.close()
+
+
 if __name__ == '__main__':
-    init_db()
-    print("Database successfully created.")
+    # `python database/init_db.py --indexes-only` runs just the online
+    # index step, e.g. against production without re-running the DDL.
+    if "--indexes-only" not in sys.argv:
+        init_db()
+        print("Database successfully created.")
+    create_hot_path_indexes()
+    print("Hot-path indexes in place.")
@@ -2,7 +2,19 @@
 Single source of truth for database access.
 
 Design:
-- One pooled psycopg2 connection pool, created once at import time.
+- One pooled psycopg2 connection pool per process, created lazily on
+  first use -- never at import. A pre-forking server (gunicorn) imports
+  the app once in the master and forks workers from it; a pool opened
+  before the fork would hand the same sockets to every worker. Each
+  process instead builds its own pool the first time it needs one, and
+  a pool inherited across a fork is detected (by pid) and replaced.
+  It's our own ThreadSafeConnectionPool below, not psycopg2's
+  SimpleConnectionPool: that one is documented as not thread-safe, yet
+  waitress serves requests on several threads and the scheduler's jobs
+  share the same pool. Checkout blocks (up to DB_POOL_TIMEOUT) for a
+  free connection instead of failing instantly with PoolError, and the
+  pool keeps live metrics (see ThreadSafeConnectionPool.metrics) so
+  DB_POOL_MAX can be sized from data.
 - Every consumer (routes, services, and background jobs) gets a connection
   through get_db(), and NEVER calls conn.close() directly -- Flask's
   teardown_appcontext (registered in app.py) returns it to the pool
@@ -10,20 +22,44 @@ Design:
 - Background jobs (the scheduler) are required to run inside an explicit
   `with app.app_context():` block so this same pooling story applies to
   them too -- there is no separate "unpooled" path anywhere in the app.
+- Optional read replica: when DB_READ_HOST is set, a second pool points
+  at it and get_db(readonly=True) -- used by the pure-read service
+  functions behind member GET traffic -- is served from there. Without
+  it, readonly connections come from the primary pool as before, so the
+  same code runs unchanged on a single database.
 """
 
 from flask import has_app_context, g
+import bisect
+import logging
+import threading
+import time
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import extensions, pool
 from psycopg2.extras import RealDictCursor
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
 DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
 DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+# How long a checkout waits for a free connection before giving up.
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Retry-After (seconds) sent with the 503 when that wait runs out.
+DB_POOL_RETRY_AFTER = int(os.getenv("DB_POOL_RETRY_AFTER", "2"))
+# Run DISCARD ALL on every connection returned to the pool (drops temp
+# tables, prepared statements, session GUCs). Off by default: a direct
+# Postgres session benefits, a transaction-mode pooler (port 6543) gets
+# nothing from it but an extra round trip.
+DB_POOL_DISCARD_ON_RETURN = os.getenv("DB_POOL_DISCARD_ON_RETURN", "0") == "1"
+# An idle connection older than this is pinged (SELECT 1) before being
+# handed out, so a connection the server/pooler silently dropped never
+# reaches a request. 0 pings on every checkout.
+DB_POOL_HEALTHCHECK_IDLE_SECONDS = float(os.getenv("DB_POOL_HEALTHCHECK_IDLE_SECONDS", "30"))
 
 conn_params = {
     "host": os.getenv("DB_HOST"),
@@ -44,10 +80,288 @@ if missing:
         f"Missing required DB config in .env: {', '.join(missing)}"
     )
 
-db_pool = psycopg2.pool.SimpleConnectionPool(DB_POOL_MIN, DB_POOL_MAX, **conn_params)
+# Read replica -- same database/credentials, different host. Unset means
+# "no replica": readonly reads use the primary pool.
+DB_READ_HOST = os.getenv("DB_READ_HOST")
+DB_READ_POOL_MAX = int(os.getenv("DB_READ_POOL_MAX", str(DB_POOL_MAX)))
+read_conn_params = dict(
+    conn_params,
+    host=DB_READ_HOST,
+    port=os.getenv("DB_READ_PORT") or conn_params["port"],
+) if DB_READ_HOST else None
+
+
+class PoolTimeout(pool.PoolError):
+    """No connection became free within the checkout timeout."""
+
+
+class ThreadSafeConnectionPool:
+    """
+    Fixed-ceiling psycopg2 connection pool, safe to share across threads.
 
+    getconn() hands out an idle connection, opens a new one while under
+    maxconn, and otherwise waits on a condition variable until one is
+    returned or the timeout expires (PoolTimeout). Connections are opened,
+    health-checked and reset outside the lock, so a slow connect, ping or
+    rollback never stalls other threads' checkouts.
 
-def get_db():
+    Return hygiene (putconn): an open transaction is rolled back -- a
+    read-only request that ran a SELECT would otherwise leave the
+    connection "idle in transaction", pinning a snapshot and holding back
+    autovacuum until someone happened to commit on it. The readonly flag
+    set by get_db(readonly=True) is cleared, and DISCARD ALL runs if
+    discard_on_return is set.
+    """
+
+    # Upper bounds (ms) of the checkout-latency histogram buckets; the
+    # last bucket catches everything slower.
+    LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self, minconn, maxconn, discard_on_return=False,
+                 healthcheck_idle_seconds=30.0, **kwargs):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.discard_on_return = discard_on_return
+        self.healthcheck_idle_seconds = healthcheck_idle_seconds
+        self._kwargs = kwargs
+        self._cond = threading.Condition()
+        self._idle = []  # (conn, returned_at), most recently returned last
+        self._in_use = {}  # id(conn) -> (conn, checked_out_at)
+        self._size = 0
+        self._waiters = 0
+        self._closed = False
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._latency_counts = [0] * (len(self.LATENCY_BUCKETS_MS) + 1)
+        self._latency_total_ms = 0.0
+        self._max_hold_seconds = 0.0
+        self._healthcheck_failures = 0
+
+        for _ in range(minconn):
+            self._idle.append((psycopg2.connect(**kwargs), time.monotonic()))
+            self._size += 1
+
+    def getconn(self, timeout=None):
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+        while True:
+            conn, idle_since = self._acquire(timeout, deadline)
+            if conn is None:
+                try:
+                    conn = psycopg2.connect(**self._kwargs)
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                break
+            if self._healthy(conn, idle_since):
+                break
+            # Dead connection: drop it and its slot, then try again.
+            with self._cond:
+                self._size -= 1
+                self._healthcheck_failures += 1
+                self._cond.notify()
+            self._close_quietly(conn)
+
+        now = time.monotonic()
+        elapsed_ms = (now - started) * 1000
+        with self._cond:
+            self._in_use[id(conn)] = (conn, now)
+            self._checkouts += 1
+            self._latency_total_ms += elapsed_ms
+            self._latency_counts[bisect.bisect_left(self.LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        return conn
+
+    def _acquire(self, timeout, deadline):
+        """(idle conn, returned_at), or (None, None) after reserving a slot
+        for a new connection. Waits while the pool is at its ceiling."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise pool.PoolError("connection pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.maxconn:
+                    # Reserve the slot now, connect after releasing the lock.
+                    self._size += 1
+                    return None, None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"no database connection free within {timeout}s "
+                        f"({self.maxconn} in use)"
+                    )
+                self._waiters += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+    def _healthy(self, conn, idle_since):
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.healthcheck_idle_seconds:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, conn):
+        """Return-to-pool hygiene. Returns False if the connection should be
+        discarded instead of reused."""
+        if conn.closed:
+            return False
+        try:
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if conn.readonly is not None:
+                # Undo get_db(readonly=True). Autocommit is off, so this is
+                # client-side only: psycopg2 just stops adding READ ONLY
+                # to the BEGIN of later transactions.
+                conn.readonly = None
+            if self.discard_on_return:
+                conn.autocommit = True
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute("DISCARD ALL")
+                finally:
+                    conn.autocommit = False
+            return True
+        except Exception:
+            return False
+
+    def putconn(self, conn, close=False):
+        if not close and not self._reset(conn):
+            close = True
+
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+            if entry is None:
+                raise pool.PoolError("trying to put unkeyed connection")
+            now = time.monotonic()
+            held = now - entry[1]
+            if held > self._max_hold_seconds:
+                self._max_hold_seconds = held
+            discard = close or conn.closed or self._closed
+            if discard:
+                self._size -= 1
+            else:
+                self._idle.append((conn, now))
+            self._cond.notify()
+
+        if discard:
+            self._close_quietly(conn)
+
+    @staticmethod
+    def _close_quietly(conn):
+        if not conn.closed:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def closeall(self):
+        with self._cond:
+            self._closed = True
+            conns = [c for c, _ in self._idle] + [c for c, _ in self._in_use.values()]
+            self._idle = []
+            self._cond.notify_all()
+        for conn in conns:
+            self._close_quietly(conn)
+
+    def metrics(self):
+        """Point-in-time snapshot of pool usage, for sizing DB_POOL_MAX."""
+        now = time.monotonic()
+        with self._cond:
+            longest_current_hold = max(
+                (now - since for _, since in self._in_use.values()), default=0.0
+            )
+            labels = [f"<={b}ms" for b in self.LATENCY_BUCKETS_MS] + [
+                f">{self.LATENCY_BUCKETS_MS[-1]}ms"
+            ]
+            return {
+                "max": self.maxconn,
+                "open": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiters": self._waiters,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "healthcheck_failures": self._healthcheck_failures,
+                "checkout_latency_ms": dict(zip(labels, self._latency_counts)),
+                "checkout_latency_avg_ms": (
+                    self._latency_total_ms / self._checkouts if self._checkouts else 0.0
+                ),
+                "max_hold_seconds": max(self._max_hold_seconds, longest_current_hold),
+                "longest_current_hold_seconds": longest_current_hold,
+            }
+
+
+_pools_lock = threading.Lock()
+_pools_pid = None
+_primary_pool = None
+_replica_pool = None
+# Pools a child inherited from its parent. Kept referenced, never used or
+# closed: closing (or garbage-collecting) a psycopg2 connection sends the
+# server a Terminate, which would end the PARENT's session.
+_inherited_pools = []
+# Per-process size overrides, see configure_pools().
+_pool_overrides = {}
+
+
+def configure_pools(minconn=None, maxconn=None):
+    """
+    Resize this process's pools before first use -- e.g. the background
+    worker (worker.py) runs a couple of jobs, not DB_POOL_MAX concurrent
+    requests, and shouldn't hold connections it will never use. Applies to
+    the replica pool's ceiling too.
+    """
+    with _pools_lock:
+        if _pools_pid == os.getpid():
+            raise RuntimeError("configure_pools() must be called before the first get_db()")
+        if minconn is not None:
+            _pool_overrides["minconn"] = minconn
+        if maxconn is not None:
+            _pool_overrides["maxconn"] = maxconn
+
+
+def _pools():
+    """(primary pool, replica pool or None) for the current process."""
+    global _pools_pid, _primary_pool, _replica_pool
+    pid = os.getpid()
+    if _pools_pid != pid:
+        with _pools_lock:
+            if _pools_pid != pid:
+                _inherited_pools.extend(p for p in (_primary_pool, _replica_pool) if p)
+                maxconn = _pool_overrides.get("maxconn")
+                minconn = min(_pool_overrides.get("minconn", DB_POOL_MIN), maxconn or DB_POOL_MAX)
+                _primary_pool = ThreadSafeConnectionPool(
+                    minconn, maxconn or DB_POOL_MAX,
+                    discard_on_return=DB_POOL_DISCARD_ON_RETURN,
+                    healthcheck_idle_seconds=DB_POOL_HEALTHCHECK_IDLE_SECONDS,
+                    **conn_params,
+                )
+                _replica_pool = ThreadSafeConnectionPool(
+                    0, maxconn or DB_READ_POOL_MAX,
+                    discard_on_return=DB_POOL_DISCARD_ON_RETURN,
+                    healthcheck_idle_seconds=DB_POOL_HEALTHCHECK_IDLE_SECONDS,
+                    **read_conn_params,
+                ) if read_conn_params else None
+                _pools_pid = pid
+    return _primary_pool, _replica_pool
+
+
+def get_db(timeout=None, readonly=False):
     """
     Get the app-context-scoped pooled connection.
 
@@ -55,22 +369,98 @@ def get_db():
     or an explicit `with app.app_context():` block for background jobs.
     Raises loudly instead of silently falling back to an untracked
     connection, so pooling behavior is never ambiguous.
+
+    Waits at most `timeout` seconds (default DB_POOL_TIMEOUT) for a free
+    connection, then raises PoolTimeout. The failure is also flagged on
+    `g`, because many routes catch every exception and turn it into a
+    500 -- app.py uses the flag to answer 503 + Retry-After either way.
+
+    readonly=True is for pure-read service functions (the GET endpoints):
+    the connection comes from the read replica when one is configured
+    (DB_READ_HOST), else the primary, and every transaction on it starts
+    as BEGIN READ ONLY, so an accidental write fails loudly; the rollback
+    on return to the pool ends it. Deliberately NOT autocommit: in
+    autocommit mode psycopg2 applies readonly as a session-level
+    `SET default_transaction_read_only`, and behind the transaction
+    pooler (port 6543) that SET would stick to a shared server backend
+    that later serves other clients' -- including our own -- writes. It's a
+    separate app-context slot from the read-write connection -- except
+    that if this context already holds the read-write one, that's reused,
+    so reads after a write in the same request see it (a replica may lag)
+    and don't cost a second checkout. If the replica can't be reached at
+    all, reads fall back to the primary rather than failing.
     """
     if not has_app_context():
         raise RuntimeError(
             "get_db() called outside of an application context. "
             "Background jobs must run inside `with app.app_context():`."
         )
+    primary, replica = _pools()
+    if readonly:
+        if "db" in g:
+            return g.db
+        if "db_ro" not in g:
+            source = replica or primary
+            try:
+                conn = _checkout(source, timeout)
+            except psycopg2.OperationalError as e:
+                if source is primary:
+                    raise
+                logger.warning("Read replica unavailable, reading from primary: %s", e)
+                source = primary
+                conn = _checkout(source, timeout)
+            try:
+                conn.set_session(readonly=True)
+            except Exception:
+                source.putconn(conn, close=True)
+                raise
+            g.db_ro = conn
+            g.db_ro_pool = source
+        return g.db_ro
+
     if "db" not in g:
-        g.db = db_pool.getconn()
+        g.db = _checkout(primary, timeout)
     return g.db
 
 
+def _checkout(source, timeout):
+    try:
+        return source.getconn(timeout=DB_POOL_TIMEOUT if timeout is None else timeout)
+    except PoolTimeout:
+        g.db_pool_exhausted = True
+        raise
+
+
 def close_db(e=None):
     """
-    Return the app-context-scoped connection to the pool.
+    Return the app-context-scoped connection(s) to the pool.
     Registered on app.teardown_appcontext -- nothing else should call this.
     """
     db = g.pop("db", None)
+    db_ro = g.pop("db_ro", None)
+    source = g.pop("db_ro_pool", None)
     if db is not None:
-        db_pool.putconn(db)
+        _pools()[0].putconn(db)
+    if db_ro is not None:
+        source.putconn(db_ro)
+
+
+_rejections_lock = threading.Lock()
+_rejected_requests = 0
+
+
+def record_pool_rejection():
+    """Count one request turned away with a 503 because the pool was full."""
+    global _rejected_requests
+    with _rejections_lock:
+        _rejected_requests += 1
+
+
+def pool_metrics():
+    primary, replica = _pools()
+    metrics = primary.metrics()
+    metrics["pid"] = os.getpid()
+    metrics["replica"] = replica.metrics() if replica else None
+    with _rejections_lock:
+        metrics["rejected_requests"] = _rejected_requests
+    return metrics
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+from services.jobs import get_job
+from utils.token import role_required
+
+jobs_bp = Blueprint('jobs', __name__)
+
+
+# Status of a queued admin job (see services/jobs.py) -- what the admin
+# UI polls after triggering a processing run.
+@jobs_bp.route('/<int:job_id>', methods=['GET'])
+@role_required('admin')
+def job_status(job_id):
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({'message': 'Job not found'}), 404
+    return jsonify(job), 200
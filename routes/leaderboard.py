@@ -1,8 +1,22 @@
-from flask import Blueprint, jsonify, request
-from services.leaderboard import get_leaderboard as fetch_leaderboard
+from flask import Blueprint, jsonify, request, Response
+from services.leaderboard import get_leaderboard_snapshot
 
 leaderboard_bp = Blueprint('leaderboard', __name__, url_prefix="/api/leaderboard")
 
+ETAG_PREFIX = "lb-"
+
+
+def _known_version():
+    """Snapshot version the client already holds, from If-None-Match."""
+    for tag in request.if_none_match.as_set():
+        if tag.startswith(ETAG_PREFIX):
+            try:
+                return int(tag[len(ETAG_PREFIX):])
+            except ValueError:
+                pass
+    return None
+
+
 @leaderboard_bp.route('', methods=['GET', 'OPTIONS'], strict_slashes=False)
 @leaderboard_bp.route('/', methods=['GET', 'OPTIONS'], strict_slashes=False)
 def leaderboard():
@@ -11,8 +25,18 @@ def leaderboard():
         return jsonify({}), 200
 
     try:
-        data = fetch_leaderboard()
-        return jsonify(data), 200
+        # Served straight from the pre-serialized snapshot (see
+        # services/leaderboard.py); an unchanged poll gets a bodyless 304.
+        known_version = _known_version()
+        version, payload = get_leaderboard_snapshot(known_version)
+        if version is not None and payload is None:
+            response = Response(status=304)
+        else:
+            response = Response(payload, status=200, mimetype="application/json")
+        if version is not None:
+            response.set_etag(f"{ETAG_PREFIX}{version}")
+            response.headers["Cache-Control"] = "no-cache"
+        return response
     except Exception as e:
         print("Error fetching leaderboard:", e)
         return jsonify({"error": "Failed to fetch leaderboard"}), 500
@@ -2,10 +2,10 @@ from flask import Blueprint, request, jsonify
 from services.predictions import (
     submit_matchday_predictions, get_user_predictions,
     get_predictions_by_matchday, update_fixture_result,
-    evaluate_predictions, process_and_evaluate_latest_matchday,
-    get_final_round_results, get_user_matchday_performance,
+    evaluate_predictions, get_final_round_results, get_user_matchday_performance,
     get_latest_completed_user_predictions, get_previous_matchday_performance
 )
+from services.jobs import enqueue_job
 from utils.token import token_required, role_required
 
 predictions_bp = Blueprint("predictions", __name__)
@@ -48,10 +48,14 @@ def submit_predictions():
         return jsonify({"message": "Invalid predictions format"}), 400
 
     try:
-        ok, msg = submit_matchday_predictions(user_id, predictions)
+        ok, result = submit_matchday_predictions(user_id, predictions)
         if ok:
-            return jsonify({"message": "Predictions submitted"}), 201
-        return jsonify({"message": msg or "Submission failed"}), 400
+            return jsonify({
+                "message": "Predictions submitted",
+                "changed": result["changed"],
+                "unchanged": result["unchanged"],
+            }), 201
+        return jsonify({"message": result or "Submission failed"}), 400
     except Exception as e:
         print("Server error in submit_predictions:", e)
         return jsonify({"message": f"Server error: {str(e)}"}), 500
@@ -113,21 +117,24 @@ def post_result():
 
 
 # --- Admin: process latest matchday ---
+# Both admin pipelines are queued (services/jobs.py) rather than run in
+# the request -- the BBC fetch + scoring takes seconds. The response
+# carries the job id; poll GET /api/jobs/<id> for the outcome.
 @predictions_bp.route("/admin/process-latest-matchday", methods=["POST", "OPTIONS"])
 @role_required("admin")
 def process_latest_matchday():
     if request.method == "OPTIONS":
         return jsonify({}), 200
     try:
-        process_and_evaluate_latest_matchday()
-        return jsonify({"message": "Processing triggered"}), 200
+        job_id, _ = enqueue_job("process_latest_matchday", created_by=request.user.get("user_id"))
+        return jsonify({"message": "Processing queued", "job_id": job_id}), 202
     except Exception as e:
         print("Error in process_latest_matchday:", e)
         return jsonify({"error": "Failed to process matchday"}), 500
 
 
 # --- Admin: force-check any fixtures whose result may now be available ---
-# (the per-fixture incremental path -- normally runs hourly via the
+# (the per-fixture incremental path -- normally run by the adaptive
 # scheduler; this lets an admin trigger it on demand, e.g. right after
 # watching a match finish, without waiting for the next scheduled run.)
 @predictions_bp.route("/admin/process-pending-results", methods=["POST", "OPTIONS"])
@@ -136,9 +143,8 @@ def process_pending_results_route():
     if request.method == "OPTIONS":
         return jsonify({}), 200
     try:
-        from services.collect_results import process_pending_results
-        process_pending_results()
-        return jsonify({"message": "Pending results check triggered"}), 200
+        job_id, _ = enqueue_job("process_pending_results", created_by=request.user.get("user_id"))
+        return jsonify({"message": "Pending results check queued", "job_id": job_id}), 202
     except Exception as e:
         print("Error in process_pending_results_route:", e)
         return jsonify({"error": "Failed to process pending results"}), 500
@@ -10,7 +10,7 @@ def final_round_results():
         return jsonify({}), 200
 
     try:
-        with get_db() as conn:
+        with get_db(readonly=True) as conn:
             # Use RealDictCursor to get dict-like rows
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 # Get latest completed matchday
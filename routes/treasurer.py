@@ -2,7 +2,7 @@ from flask import Blueprint, request, jsonify
 from services.treasurer import (
     set_fee_config, get_active_fee_config, get_payment_status_list,
     mark_paid, grant_exception, get_exceptions_log, get_user_eligibility,
-    get_fee_config_history
+    get_fee_config_history, get_roster_eligibility
 )
 from services.savings import get_savings_config_history
 from utils.token import token_required, role_required
@@ -78,6 +78,17 @@ def payment_status():
     ]), 200
 
 
+# Whole-roster view of the same eligibility rules members see for
+# themselves -- one query for everyone, for the fee-week dashboard.
+@treasurer_bp.route('/roster-eligibility', methods=['GET'])
+@role_required('admin', 'treasurer', 'secretary')
+def roster_eligibility():
+    rows = get_roster_eligibility()
+    for r in rows:
+        r['confirmed_at'] = r['confirmed_at'].isoformat() if r['confirmed_at'] else None
+    return jsonify(rows), 200
+
+
 @treasurer_bp.route('/mark-paid/<int:user_id>', methods=['POST'])
 @role_required('treasurer')
 def post_mark_paid(user_id):
@@ -7,48 +7,271 @@ interpreter startup cost every run, breaking normal exception handling
 load_dotenv()/DB setup on every single invocation. Jobs now run in-process
 as plain function calls, each wrapped in an explicit app context so they
 share the same connection pool and config as the rest of the app.
+
+They can run on threads inside the web process (start_scheduler, used by
+`python app.py` unless RUN_SCHEDULER_IN_PROCESS=0) or in a dedicated
+process (`python -m worker`, run_scheduler_blocking). Either way the
+schedules are pinned to the wall clock (UTC cron fields, results checks
+rounded to RESULT_POLL_MINUTES), so every process fires the same ticks,
+and each run first claims that tick's lease row (_run_exclusive,
+services/jobs.claim_job_lease) -- however many processes fire a tick,
+the job runs once. Every scheduler also polls the admin job queue
+(services/jobs.py) every JOB_POLL_SECONDS.
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
+from datetime import datetime, timedelta, timezone
 import atexit
 import logging
+import os
+import signal
+import threading
+import time
+from db import get_db
 
 logger = logging.getLogger(__name__)
+# APScheduler logs every execution at INFO; with the job queue polled
+# every few seconds that would drown everything else. Our jobs log their
+# own outcomes.
+logging.getLogger("apscheduler.executors.default").setLevel(logging.WARNING)
+
+# How often each process checks the jobs table, and how many queued jobs
+# it may run at once.
+JOB_POLL_SECONDS = int(os.getenv("JOB_POLL_SECONDS", "5"))
+JOB_WORKER_THREADS = int(os.getenv("JOB_WORKER_THREADS", "1"))
+# How often each process sweeps for jobs abandoned mid-run. They are only
+# considered abandoned after JOB_STALE_AFTER_SECONDS, so sweeping at the
+# queue poll rate would be thousands of pointless UPDATEs a day.
+JOB_STALE_SWEEP_SECONDS = int(os.getenv("JOB_STALE_SWEEP_SECONDS", "300"))
+
+# Adaptive results polling (see _schedule_results_check).
+RESULT_POLL_MINUTES = int(os.getenv("RESULT_POLL_MINUTES", "5"))
+RESULT_IDLE_REPLAN_HOURS = int(os.getenv("RESULT_IDLE_REPLAN_HOURS", "6"))
+
+# Scheduled jobs added by _add_jobs besides the queue drain (fixture
+# fetch, results check, savings rollover, stale-job sweep). Each holds a
+# pool connection while it runs, so a process running them all needs
+# this many plus JOB_WORKER_THREADS.
+SCHEDULED_JOB_COUNT = 4
+
+# Wall-clock schedules (UTC) and the tick length each one runs on: fixture
+# fetch every 2 hours on the hour, savings rollover daily at 00:10.
+FETCH_FIXTURES_TRIGGER = CronTrigger(hour="*/2", minute=0, timezone=timezone.utc)
+FETCH_FIXTURES_PERIOD = 2 * 3600
+SAVINGS_ROLLOVER_TRIGGER = CronTrigger(hour=0, minute=10, timezone=timezone.utc)
+SAVINGS_ROLLOVER_PERIOD = 24 * 3600
+# How late a process may still fire a cron tick (busy executor, GC pause).
+CRON_MISFIRE_GRACE_SECONDS = 300
+
+
+# Per-job lease counters for this process (see job_metrics).
+_stats_lock = threading.Lock()
+_job_stats = {}
+
+
+def _record(job, acquired, claim_ms):
+    with _stats_lock:
+        stats = _job_stats.setdefault(job, {
+            "runs": 0, "skips": 0, "claim_ms_total": 0.0,
+            "claim_ms_max": 0.0, "last_run_at": None, "last_skip_at": None,
+        })
+        stats["claim_ms_total"] += claim_ms
+        stats["claim_ms_max"] = max(stats["claim_ms_max"], claim_ms)
+        now = datetime.now(timezone.utc).isoformat()
+        if acquired:
+            stats["runs"] += 1
+            stats["last_run_at"] = now
+        else:
+            stats["skips"] += 1
+            stats["last_skip_at"] = now
 
 
-def _run_fetch_fixtures(app):
+def job_metrics():
+    """Runs/skips and lease claim times per job, for this process."""
+    with _stats_lock:
+        return {job: dict(stats) for job, stats in _job_stats.items()}
+
+
+def _floor_tick(moment, period_seconds):
+    """The start of the period_seconds-long tick (counted from the Unix
+    epoch, so identical in every process) that `moment` falls in."""
+    epoch = int(moment.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % period_seconds, timezone.utc)
+
+
+def _ceil_tick(moment, period_seconds):
+    floor = _floor_tick(moment, period_seconds)
+    return floor if floor == moment else floor + timedelta(seconds=period_seconds)
+
+
+def _run_exclusive(app, job, fn, tick):
+    """
+    Run fn at most once cluster-wide for schedule tick `tick`: with
+    several app or worker processes each firing the same schedule,
+    whoever claims the job's lease for that tick runs it and the rest
+    skip. Without this every process would repeat the BBC calls and
+    recomputes, and race each other in get_next_matchday.
+    """
+    from services.jobs import claim_job_lease, release_job_lease
     with app.app_context():
         try:
-            from services.fetch_fixtures import auto_update_if_due
-            auto_update_if_due()
+            started = time.monotonic()
+            acquired = claim_job_lease(job, tick)
+            claim_ms = (time.monotonic() - started) * 1000
+            _record(job, acquired, claim_ms)
+            logger.info(
+                "job_lease job=%s tick=%s acquired=%s claim_ms=%.1f",
+                job, tick.isoformat(), acquired, claim_ms,
+            )
+            if not acquired:
+                return
+            try:
+                fn()
+            except Exception:
+                get_db().rollback()
+                raise
+            finally:
+                release_job_lease(job)
         except Exception:
-            logger.exception("Fixture fetch job failed")
+            logger.exception("%s job failed", job)
+
+
+def _run_fetch_fixtures(app, scheduler):
+    from services.fetch_fixtures import auto_update_if_due
+    tick = _floor_tick(datetime.now(timezone.utc), FETCH_FIXTURES_PERIOD)
+    _run_exclusive(app, "fetch_fixtures", auto_update_if_due, tick)
+    # A new matchday may have landed -- re-aim the results check at it.
+    _schedule_results_check(app, scheduler, just_ran=False)
+
 
+def _run_collect_and_evaluate_results(app, scheduler, tick):
+    from services.collect_results import process_pending_results
+    _run_exclusive(app, "collect_results", process_pending_results, tick)
+    _schedule_results_check(app, scheduler, just_ran=True)
 
-def _run_collect_and_evaluate_results(app):
+
+def _schedule_results_check(app, scheduler, just_ran):
+    """
+    Results checking runs on a self-planned one-shot schedule instead of a
+    fixed hourly interval: every RESULT_POLL_MINUTES while some fixture is
+    past kickoff + RESULT_CHECK_BUFFER and unscored, otherwise not until
+    the next one will be. With nothing to score at all it only re-plans
+    every RESULT_IDLE_REPLAN_HOURS, which picks up fixtures another
+    process added (this process re-plans itself after its own fetch).
+
+    The run time is rounded up to a RESULT_POLL_MINUTES boundary, and
+    that boundary is the tick the lease is claimed for, so processes
+    planning from the same fixtures land on the same tick.
+    """
+    from services.collect_results import get_next_result_check_due
+    now = datetime.now(timezone.utc)
+    earliest = now + timedelta(minutes=RESULT_POLL_MINUTES) if just_ran else now
+    latest = now + timedelta(hours=RESULT_IDLE_REPLAN_HOURS)
     with app.app_context():
         try:
-            from services.collect_results import process_pending_results
-            process_pending_results()
+            due = get_next_result_check_due()
         except Exception:
-            logger.exception("Results collection job failed")
+            logger.exception("Results check planning failed; retrying at the poll interval")
+            due = now + timedelta(minutes=RESULT_POLL_MINUTES)
+    run_at = min(max(due, earliest), latest) if due else latest
+    run_at = _ceil_tick(run_at, RESULT_POLL_MINUTES * 60)
+
+    scheduler.add_job(
+        lambda: _run_collect_and_evaluate_results(app, scheduler, run_at),
+        trigger="date", run_date=run_at, id="collect_results",
+        replace_existing=True, misfire_grace_time=None,
+    )
+    logger.info("Next results check at %s", run_at.isoformat())
 
 
 def _run_savings_week_rollover(app):
+    from services.savings import process_week_rollover
+    tick = _floor_tick(datetime.now(timezone.utc), SAVINGS_ROLLOVER_PERIOD)
+    _run_exclusive(app, "savings_rollover", process_week_rollover, tick)
+
+
+def _sweep_stale_jobs(app):
+    from services.jobs import requeue_stale_jobs
     with app.app_context():
         try:
-            from services.savings import process_week_rollover
-            process_week_rollover()
+            requeue_stale_jobs()
         except Exception:
-            logger.exception("Savings week-rollover job failed")
+            logger.exception("Stale job recovery failed")
+
+
+def _drain_job_queue(app):
+    """Run queued admin jobs (services/jobs.py) until the queue is empty.
+    No lease here: SKIP LOCKED already hands each process a
+    different job, which is what lets several workers drain in parallel.
+
+    Polled every JOB_POLL_SECONDS by every process, so an empty queue
+    must cost no writes: a plain read decides whether to claim at all."""
+    from services.jobs import has_queued_jobs, run_next_job
+    with app.app_context():
+        try:
+            if not has_queued_jobs():
+                return
+        except Exception:
+            logger.exception("Job queue poll failed")
+            return
+    while True:
+        # Fresh app context per job, so each returns its connection
+        # before the next is claimed.
+        with app.app_context():
+            try:
+                if not run_next_job():
+                    return
+            except Exception:
+                logger.exception("Job queue drain failed")
+                return
+
+
+def _add_jobs(scheduler, app):
+    scheduler.add_job(
+        lambda: _run_fetch_fixtures(app, scheduler), trigger=FETCH_FIXTURES_TRIGGER,
+        misfire_grace_time=CRON_MISFIRE_GRACE_SECONDS, coalesce=True,
+    )
+    _schedule_results_check(app, scheduler, just_ran=False)
+    scheduler.add_job(
+        lambda: _run_savings_week_rollover(app), trigger=SAVINGS_ROLLOVER_TRIGGER,
+        misfire_grace_time=CRON_MISFIRE_GRACE_SECONDS, coalesce=True,
+    )
+    scheduler.add_job(
+        lambda: _drain_job_queue(app), trigger="interval", seconds=JOB_POLL_SECONDS,
+        max_instances=JOB_WORKER_THREADS, coalesce=True,
+    )
+    scheduler.add_job(
+        lambda: _sweep_stale_jobs(app), trigger="interval", seconds=JOB_STALE_SWEEP_SECONDS,
+        coalesce=True,
+    )
 
 
 def start_scheduler(app):
+    """Run the jobs on background threads inside the web process."""
     scheduler = BackgroundScheduler()
-    scheduler.add_job(lambda: _run_fetch_fixtures(app), trigger="interval", hours=2)
-    scheduler.add_job(lambda: _run_collect_and_evaluate_results(app), trigger="interval", hours=1)
-    scheduler.add_job(lambda: _run_savings_week_rollover(app), trigger="interval", hours=24)
+    _add_jobs(scheduler, app)
 
     scheduler.start()
-    logger.info("Scheduler started: fixtures every 2h, results+evaluation every 1h, savings rollover every 24h.")
+    logger.info("Scheduler started: fixtures every 2h on the hour, results+evaluation adaptive, savings rollover daily at 00:10 UTC.")
     atexit.register(lambda: scheduler.shutdown())
+
+
+def run_scheduler_blocking(app):
+    """Run the same jobs in the foreground until the process is stopped --
+    the standalone worker (worker.py), so none of it competes with request
+    handling for the GIL or for the web process's pool connections."""
+    scheduler = BlockingScheduler()
+    _add_jobs(scheduler, app)
+
+    def _stop(signum, frame):
+        logger.info("Worker received signal %s, shutting down scheduler", signum)
+        scheduler.shutdown(wait=False)
+
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info("Worker scheduler started: fixtures every 2h on the hour, results+evaluation adaptive, savings rollover daily at 00:10 UTC.")
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        pass
@@ -7,6 +7,8 @@ except ImportError:
 
 from db import get_db
 from services.audit import log_action
+from services.matchday_cache import invalidate_matchday_cache
+from services.leaderboard import refresh_leaderboard_snapshot
 
 UK_TIMEZONE = ZoneInfo("Europe/London")
 UTC_TIMEZONE = ZoneInfo("UTC")
@@ -26,8 +28,11 @@ def approve_user(username):
     conn = get_db()
     with conn.cursor() as cur:
         cur.execute("UPDATE users SET is_approved = 1 WHERE username = %s", (username,))
+        approved = cur.rowcount > 0
         conn.commit()
-        return cur.rowcount > 0
+    if approved:
+        refresh_leaderboard_snapshot()
+    return approved
 
 
 def reject_user(username):
@@ -72,7 +77,8 @@ def add_fixture(matchday, home_team, away_team, kickoff_time_str):
             VALUES (%s, %s, %s, %s, %s)
         """, (fixture_id, matchday, home_team, away_team, utc_time_str))
         conn.commit()
-        return True
+    invalidate_matchday_cache(matchday)
+    return True
 
 
 def get_all_fixtures():
@@ -86,13 +92,7 @@ def get_all_fixtures():
 
     fixtures = []
     for row in rows:
-        kickoff_time_str = row['kickoff_time']
-        try:
-            utc_time = datetime.fromisoformat(kickoff_time_str)
-            local_time = utc_time.astimezone(UK_TIMEZONE)
-            display_time = local_time.isoformat()
-        except Exception:
-            display_time = kickoff_time_str
+        display_time = row['kickoff_time'].astimezone(UK_TIMEZONE).isoformat()
 
         fixtures.append({
             'id': row['id'],
@@ -203,7 +203,8 @@ def _erase_user(username, error_prefix="deleting"):
             cur.execute("DELETE FROM users WHERE id = %s", (user_id,))
 
             conn.commit()
-            return True
+        refresh_leaderboard_snapshot()
+        return True
     except Exception as e:
         conn.rollback()
         print(f"Error {error_prefix} user {username}: {e}")
@@ -214,5 +215,8 @@ def update_fixture_result(fixture_id, result):
     conn = get_db()
     with conn.cursor() as cur:
         cur.execute("UPDATE fixtures SET result = %s WHERE id = %s", (result, fixture_id))
+        updated = cur.rowcount > 0
         conn.commit()
-        return cur.rowcount > 0
\ No newline at end of file
+    if updated:
+        refresh_leaderboard_snapshot()
+    return updated
\ No newline at end of file
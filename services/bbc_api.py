@@ -0,0 +1,109 @@
+"""
+BBC sport scores/fixtures endpoint, shared by the fixture fetcher
+(fetch_fixtures.py) and the results collectors (collect_results.py).
+
+The endpoint takes a date RANGE (selectedStartDate..selectedEndDate), but
+both callers used to send start == end, one call per day. Here the dates
+a caller needs are packed into as few windows as BBC_MAX_RANGE_DAYS
+allows -- a 16-day fixture window or a weekend of pending results is one
+call -- and the response is split back out by each event's own date.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from services.http_client import get_json
+
+logger = logging.getLogger(__name__)
+
+BBC_API = "https://web-cdn.api.bbci.co.uk/wc-poll-data/container/sport-data-scores-fixtures"
+BBC_URN = "urn:bbc:sportsdata:football:tournament-collection:collated"
+
+# Widest span (days, inclusive) asked for in one request. Dates further
+# apart than this are split into separate requests.
+BBC_MAX_RANGE_DAYS = int(os.getenv("BBC_MAX_RANGE_DAYS", "16"))
+
+
+def event_date(event):
+    """YYYY-MM-DD an event is filed under -- the date prefix of its
+    startDateTime, the same thing the per-day matching compared against."""
+    return (event.get("startDateTime") or "")[:10]
+
+
+def _date_windows(date_strs):
+    """Greedily pack sorted dates into (start, end) windows no wider than
+    BBC_MAX_RANGE_DAYS."""
+    days = sorted({date.fromisoformat(d) for d in date_strs})
+    windows = []
+    for day in days:
+        if windows and (day - windows[-1][0]).days < BBC_MAX_RANGE_DAYS:
+            windows[-1][1] = day
+        else:
+            windows.append([day, day])
+    return [(start.isoformat(), end.isoformat()) for start, end in windows]
+
+
+def fetch_events_for_range(start_date, end_date, competition=None):
+    """
+    Every event between start_date and end_date (inclusive), optionally
+    only those in the event group labelled `competition`. None if the
+    request failed.
+    """
+    params = {
+        "selectedStartDate": start_date,
+        "selectedEndDate": end_date,
+        "todayDate": datetime.now().strftime('%Y-%m-%d'),
+        "urn": BBC_URN,
+    }
+    data = get_json(BBC_API, params=params)
+    if data is None:
+        logger.warning("Failed BBC request for %s..%s", start_date, end_date)
+        return None
+
+    events = []
+    try:
+        for group in data.get("eventGroups", []):
+            if competition and group.get("displayLabel") != competition:
+                continue
+            for subgroup in group.get("secondaryGroups", []):
+                events.extend(subgroup.get("events", []))
+    except (AttributeError, TypeError) as e:
+        logger.warning("Unexpected BBC payload for %s..%s: %s", start_date, end_date, e)
+        return None
+    return events
+
+
+def fetch_events_by_date(date_strs, competition=None, max_workers=1):
+    """
+    {date_str: [events]} for every requested date whose window was fetched
+    successfully (an empty list if that day simply has no events). Dates
+    in a failed window are left out, so callers can tell "nothing on" from
+    "couldn't ask". With max_workers > 1, separate windows are fetched in
+    parallel.
+    """
+    windows = _date_windows(date_strs)
+    if max_workers > 1 and len(windows) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(windows)),
+                                thread_name_prefix="bbc-fetch") as pool:
+            fetched = list(pool.map(lambda w: fetch_events_for_range(*w, competition), windows))
+    else:
+        fetched = [fetch_events_for_range(*w, competition) for w in windows]
+
+    by_date = {}
+    for (start, end), events in zip(windows, fetched):
+        if events is None:
+            continue
+        start_day = date.fromisoformat(start)
+        window = {
+            (start_day + timedelta(days=offset)).isoformat(): []
+            for offset in range((date.fromisoformat(end) - start_day).days + 1)
+        }
+        for event in events:
+            day_events = window.get(event_date(event))
+            if day_events is not None:
+                day_events.append(event)
+        by_date.update(window)
+
+    wanted = set(date_strs)
+    return {d: events for d, events in by_date.items() if d in wanted}
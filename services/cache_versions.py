@@ -0,0 +1,99 @@
+"""
+Cross-process invalidation for the in-process caches (eligibility in
+services/treasurer.py, matchday lock data in services/matchday_cache.py).
+
+Those caches live in each process's memory, but the writes that make
+them stale can happen in any process -- mark_paid in one gunicorn worker,
+get_next_matchday in the background worker -- so a local invalidation
+alone leaves every other process serving stale answers until the TTL.
+
+Each cache has a version counter in the cache_versions table. Writers
+bump it (after committing the write); every process polls the table at
+most every CACHE_VERSION_POLL_SECONDS, on cache use, and clears its own
+copy of any cache whose version moved. A Postgres LISTEN/NOTIFY would be
+push-based, but a LISTEN is tied to one server session, which the
+transaction pooler hands to other clients between transactions -- a
+plain counter works through the pooler.
+"""
+import logging
+import os
+import threading
+import time
+from db import get_db
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION_POLL_SECONDS = float(os.getenv("CACHE_VERSION_POLL_SECONDS", "2"))
+
+_lock = threading.Lock()
+_clear_fns = {}      # cache name -> function clearing this process's copy
+_seen = {}           # cache name -> last version seen by this process
+_last_poll = [float("-inf")]
+
+
+def register_cache(name, clear_fn):
+    """clear_fn() must drop this process's copy only -- it is what runs
+    when another process bumps the version."""
+    _clear_fns[name] = clear_fn
+
+
+def bump_cache_version(name):
+    """Tell every process that `name` is stale. Call after committing the
+    write. Best-effort: on failure the cache's TTL still bounds staleness."""
+    conn = get_db()
+    cur = conn.cursor()
+    try:
+        cur.execute("SAVEPOINT cache_version")
+        cur.execute("""
+            INSERT INTO cache_versions (name, version) VALUES (%s, 1)
+            ON CONFLICT (name) DO UPDATE SET version = cache_versions.version + 1
+        """, (name,))
+        cur.execute("RELEASE SAVEPOINT cache_version")
+        conn.commit()
+    except Exception as e:
+        try:
+            cur.execute("ROLLBACK TO SAVEPOINT cache_version")
+        except Exception:
+            conn.rollback()
+        logger.warning("cache version bump for %s failed (non-fatal): %s", name, e)
+    finally:
+        cur.close()
+
+
+def sync_cache_versions():
+    """Clear local caches that another process invalidated. Cheap to call
+    on every cache read: it queries at most every
+    CACHE_VERSION_POLL_SECONDS per process."""
+    now = time.monotonic()
+    with _lock:
+        if now - _last_poll[0] < CACHE_VERSION_POLL_SECONDS:
+            return
+        _last_poll[0] = now
+
+    conn = get_db()
+    cur = conn.cursor()
+    try:
+        cur.execute("SAVEPOINT cache_version")
+        cur.execute("SELECT name, version FROM cache_versions")
+        rows = cur.fetchall()
+        cur.execute("RELEASE SAVEPOINT cache_version")
+    except Exception as e:
+        try:
+            cur.execute("ROLLBACK TO SAVEPOINT cache_version")
+        except Exception:
+            conn.rollback()
+        logger.warning("cache version poll failed (non-fatal): %s", e)
+        return
+    finally:
+        cur.close()
+
+    changed = []
+    with _lock:
+        for row in rows:
+            if _seen.get(row["name"]) != row["version"]:
+                _seen[row["name"]] = row["version"]
+                changed.append(row["name"])
+    for name in changed:
+        clear_fn = _clear_fns.get(name)
+        if clear_fn:
+            clear_fn()
@@ -3,7 +3,6 @@ import sys
 import json
 import logging
 from datetime import datetime, timezone, timedelta
-import requests
 import psycopg2
 import psycopg2.extras
 
@@ -11,10 +10,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from db import get_db
 
 logger = logging.getLogger(__name__)
-from services.predictions import process_and_evaluate_latest_matchday, store_and_evaluate_fixture_result
+from services.predictions import process_and_evaluate_latest_matchday, store_and_evaluate_fixture_results
+from services.bbc_api import fetch_events_by_date
+from services.team_names import normalize_team
 
-BBC_API = "https://web-cdn.api.bbci.co.uk/wc-poll-data/container/sport-data-scores-fixtures"
-BBC_URN = "urn:bbc:sportsdata:football:tournament-collection:collated"
 
 # How long after kickoff before we bother asking the API whether a fixture
 # has finished. 90 min regulation + halftime + typical stoppage time is
@@ -24,6 +23,33 @@ BBC_URN = "urn:bbc:sportsdata:football:tournament-collection:collated"
 # "don't bother checking yet", not "trust the clock as the source of truth".
 RESULT_CHECK_BUFFER = timedelta(hours=2, minutes=15)
 
+# A fixture still unscored this long after kickoff (postponed, abandoned,
+# never matched) no longer drives the tight results polling -- otherwise
+# one postponed game would keep the scheduler polling every few minutes
+# for weeks. It's still picked up by any later run.
+RESULT_TIGHT_POLL_WINDOW = timedelta(days=2)
+
+
+def _utc_date_str(kickoff):
+    """YYYY-MM-DD of a kickoff_time (timestamptz) in UTC."""
+    return kickoff.astimezone(timezone.utc).strftime('%Y-%m-%d')
+
+
+def _event_utc_date_str(start_date_time):
+    """
+    YYYY-MM-DD in UTC of a BBC startDateTime. The API files (and the
+    date-range request selects) events by their LOCAL date -- the
+    startDateTime[:10] prefix -- which for a late kickoff is the day after
+    its UTC date, so matching compares both sides in UTC instead.
+    """
+    try:
+        kickoff = datetime.fromisoformat(start_date_time.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return (start_date_time or "")[:10]
+    if kickoff.tzinfo is None:
+        return kickoff.strftime('%Y-%m-%d')
+    return _utc_date_str(kickoff)
+
 
 # Ensure get_db returns a DictCursor
 def get_dict_db():
@@ -47,12 +73,7 @@ def get_latest_completed_matchday():
                 last_kickoff = row.get('last_ko') if row else None
 
                 if last_kickoff:
-                    if isinstance(last_kickoff, str):
-                        last_kickoff_time = datetime.fromisoformat(last_kickoff)
-                    else:
-                        last_kickoff_time = last_kickoff
-
-                    if datetime.now(timezone.utc) > last_kickoff_time + timedelta(hours=4):
+                    if datetime.now(timezone.utc) > last_kickoff + timedelta(hours=4):
                         cur.execute("SELECT 1 FROM results WHERE matchday = %s", (md,))
                         exists = cur.fetchone()
                         if not exists:
@@ -60,8 +81,106 @@ def get_latest_completed_matchday():
     return None
 
 
+def _finished_event(event):
+    """The scored-result view of one BBC event, or None unless it has
+    actually gone final (status Result/PostEvent) with a score attached."""
+    if event.get("status") not in ["Result", "PostEvent"]:
+        return None
+    score_home = event.get("home", {}).get("runningScores", {}).get("fulltime")
+    score_away = event.get("away", {}).get("runningScores", {}).get("fulltime")
+    if score_home is None or score_away is None:
+        return None
+    return {
+        "home": event.get("home", {}).get("fullName", "").lower(),
+        "away": event.get("away", {}).get("fullName", "").lower(),
+        "kickoff": event.get("startDateTime", ""),
+        "home_score": score_home,
+        "away_score": score_away,
+    }
+
+
+def _fetch_finished_events_by_date(date_strs):
+    """
+    {date_str: [finished events]} for the given dates, fetched as
+    date-range requests (services/bbc_api.py) -- every pending date in
+    one or two calls instead of one call per date. Dates whose request
+    failed are missing from the result.
+    """
+    by_date = {}
+    for date_str, events in fetch_events_by_date(date_strs).items():
+        by_date[date_str] = [f for f in map(_finished_event, events) if f]
+    return by_date
+
+
+def index_events(events_by_date):
+    """
+    {(home, away, utc_date): event} over {date_str: [events]}, with team
+    names run through normalize_team -- built once per fetched payload, so
+    each fixture is matched with one dict lookup instead of a scan of the
+    day's events. Keyed by the event's own UTC kickoff date, not the
+    (local) date it was filed under. The first event wins if a key
+    repeats, as the scan did.
+    """
+    index = {}
+    for events in events_by_date.values():
+        for event in events:
+            key = (
+                normalize_team(event["home"]),
+                normalize_team(event["away"]),
+                _event_utc_date_str(event["kickoff"]),
+            )
+            index.setdefault(key, event)
+    return index
+
+
+def match_finished_fixtures(fixtures):
+    """
+    Shared fetch + match engine for both results paths (the whole-matchday
+    fetch_results_for_matchday and the incremental process_pending_results).
+
+    fixtures: rows with fixture_id, home_team, away_team and kickoff_time.
+    Groups them by UTC kickoff date, fetches every date once (as
+    date-range requests), and matches each fixture against that date's
+    finished events (via index_events, so team-name spelling variants
+    still match). Each date is requested with a day either side: the API
+    selects by local date, which differs from the UTC date for kickoffs
+    near midnight, and the padding only widens a window the dates
+    already share. Returns {fixture_id: finished event} for the
+    fixtures the API reports as finished; anything unfinished, unmatched
+    or on a date whose request failed is simply absent.
+    """
+    by_date = {}
+    for f in fixtures:
+        by_date.setdefault(_utc_date_str(f["kickoff_time"]), []).append(f)
+    if not by_date:
+        return {}
+
+    logger.info(
+        "Checking %s fixture(s) across %s date(s)...", len(fixtures), len(by_date)
+    )
+    request_dates = set()
+    for date_str in by_date:
+        day = datetime.strptime(date_str, '%Y-%m-%d')
+        for offset in (-1, 0, 1):
+            request_dates.add((day + timedelta(days=offset)).strftime('%Y-%m-%d'))
+    finished_by_date = _fetch_finished_events_by_date(sorted(request_dates))
+
+    index = index_events(finished_by_date)
+
+    matched = {}
+    for date_str, day_fixtures in by_date.items():
+        for fixture in day_fixtures:
+            key = (normalize_team(fixture["home_team"]), normalize_team(fixture["away_team"]), date_str)
+            match = index.get(key)
+            if match:
+                matched[fixture["fixture_id"]] = match
+    return matched
+
+
 def fetch_results_for_matchday(matchday):
-    """Fetch fixture results from the BBC API for a given matchday."""
+    """Fetch fixture results from the BBC API for a given matchday --
+    one request per date range, not one per fixture (see
+    match_finished_fixtures)."""
     with get_db() as conn:
         with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
             cur.execute("SELECT fixture_id, home_team, away_team, kickoff_time FROM fixtures WHERE matchday = %s", (matchday,))
@@ -70,66 +189,29 @@ def fetch_results_for_matchday(matchday):
     results_json = []
     human_results = []
 
+    matched = match_finished_fixtures(fixtures)
     for fixture in fixtures:
-        fixture_id = fixture['fixture_id']
+        event = matched.get(fixture['fixture_id'])
+        if not event:
+            continue
+
         home = fixture['home_team']
         away = fixture['away_team']
-        kickoff = fixture['kickoff_time']
-
-        date_str = kickoff[:10]  # YYYY-MM-DD
-        logger.info("Fetching results for %s vs %s on %s...", home, away, date_str)
-
-        params = {
-            "selectedStartDate": date_str,
-            "selectedEndDate": date_str,
-            "todayDate": datetime.now().strftime('%Y-%m-%d'),
-            "urn": BBC_URN
-        }
-
-        try:
-            response = requests.get(BBC_API, params=params)
-            if response.status_code != 200:
-                logger.warning("Failed request for %s: %s", date_str, response.status_code)
-                continue
-
-            data = response.json()
-            event_groups = data.get("eventGroups", [])
-
-            for group in event_groups:
-                for subgroup in group.get("secondaryGroups", []):
-                    for event in subgroup.get("events", []):
-                        if event.get("status") not in ["Result", "PostEvent"]:
-                            continue
-
-                        ev_home = event.get("home", {}).get("fullName", "").lower()
-                        ev_away = event.get("away", {}).get("fullName", "").lower()
-                        ev_kickoff = event.get("startDateTime", "")
-                        score_home = event.get("home", {}).get("runningScores", {}).get("fulltime")
-                        score_away = event.get("away", {}).get("runningScores", {}).get("fulltime")
-
-                        if (
-                            home.lower() == ev_home and
-                            away.lower() == ev_away and
-                            ev_kickoff.startswith(date_str) and
-                            score_home is not None and score_away is not None
-                        ):
-                            result_str = f"{score_home}-{score_away}"
-                            results_json.append({
-                                "fixture_id": fixture_id,
-                                "home": home,
-                                "away": away,
-                                "kickoff": kickoff,
-                                "score": {
-                                    "fulltime": {
-                                        "home": score_home,
-                                        "away": score_away
-                                    }
-                                }
-                            })
-                            human_results.append(f"{home} {score_home} - {score_away} {away}")
-                            break
-        except Exception as e:
-            logger.warning("Error fetching results for %s: %s", date_str, e)
+        score_home = event["home_score"]
+        score_away = event["away_score"]
+        results_json.append({
+            "fixture_id": fixture['fixture_id'],
+            "home": home,
+            "away": away,
+            "kickoff": fixture['kickoff_time'].isoformat(),
+            "score": {
+                "fulltime": {
+                    "home": score_home,
+                    "away": score_away
+                }
+            }
+        })
+        human_results.append(f"{home} {score_home} - {score_away} {away}")
 
     return results_json, human_results
 
@@ -188,9 +270,10 @@ def run_once():
 #
 # Instead of waiting for an entire matchday's last kickoff to be hours in
 # the past, this checks each not-yet-scored fixture individually against
-# how long ago IT kicked off, and asks the API for that specific date.
+# how long ago IT kicked off, and asks the API for that specific date
+# (batched with the other pending dates into date-range requests).
 # The API already reports each match's status independently (see the
-# "status" check in fetch_results_for_matchday above) -- a match doesn't
+# "status" check in _finished_event above) -- a match doesn't
 # need its matchday-mates to be finished for the API to say it's done.
 
 def get_pending_fixtures():
@@ -208,7 +291,7 @@ def get_pending_fixtures():
             SELECT fixture_id, home_team, away_team, kickoff_time, matchday
             FROM fixtures
             WHERE result IS NULL
-              AND kickoff_time::timestamptz <= (NOW() - %s::interval)
+              AND kickoff_time <= (NOW() - %s::interval)
             ORDER BY kickoff_time
         """, (f"{int(RESULT_CHECK_BUFFER.total_seconds())} seconds",))
         return cur.fetchall()
@@ -219,101 +302,81 @@ def get_pending_fixtures():
             pass
 
 
-def _fetch_finished_events_for_date(date_str):
+def get_next_result_check_due():
     """
-    One BBC API call for a given date, returning only events that have
-    actually gone final (status Result/PostEvent) with a score attached.
-    This is the same request/parse logic fetch_results_for_matchday uses
-    per-fixture, pulled out so process_pending_results can call it once
-    per distinct date instead of once per fixture on that date.
+    When the next results check is worth doing: the earliest unscored
+    fixture's kickoff + RESULT_CHECK_BUFFER (possibly already past, i.e.
+    due now), or None if there's nothing left to score. Drives the
+    adaptive results schedule in scheduler.py.
     """
-    params = {
-        "selectedStartDate": date_str,
-        "selectedEndDate": date_str,
-        "todayDate": datetime.now().strftime('%Y-%m-%d'),
-        "urn": BBC_URN
-    }
-
-    finished = []
+    db = get_db()
+    cur = db.cursor()
     try:
-        response = requests.get(BBC_API, params=params)
-        if response.status_code != 200:
-            logger.warning("Failed request for %s: %s", date_str, response.status_code)
-            return finished
-
-        data = response.json()
-        for group in data.get("eventGroups", []):
-            for subgroup in group.get("secondaryGroups", []):
-                for event in subgroup.get("events", []):
-                    if event.get("status") not in ["Result", "PostEvent"]:
-                        continue
-                    score_home = event.get("home", {}).get("runningScores", {}).get("fulltime")
-                    score_away = event.get("away", {}).get("runningScores", {}).get("fulltime")
-                    if score_home is None or score_away is None:
-                        continue
-                    finished.append({
-                        "home": event.get("home", {}).get("fullName", "").lower(),
-                        "away": event.get("away", {}).get("fullName", "").lower(),
-                        "kickoff": event.get("startDateTime", ""),
-                        "home_score": score_home,
-                        "away_score": score_away,
-                    })
-    except Exception as e:
-        logger.warning("Error fetching results for %s: %s", date_str, e)
-
-    return finished
-
-
-def process_pending_results():
+        cur.execute("""
+            SELECT MIN(kickoff_time) AS first_kickoff
+            FROM fixtures
+            WHERE result IS NULL
+              AND kickoff_time > (NOW() - %s::interval)
+        """, (f"{int(RESULT_TIGHT_POLL_WINDOW.total_seconds())} seconds",))
+        row = cur.fetchone()
+    finally:
+        cur.close()
+    first_kickoff = row["first_kickoff"] if row else None
+    return first_kickoff + RESULT_CHECK_BUFFER if first_kickoff else None
+
+
+def process_pending_results(raise_errors=False):
     """
     Scheduler entry point for the incremental path: check every
     not-yet-scored fixture whose kickoff is far enough in the past,
-    group them by date (one API call per date, not per fixture), and
-    score any that the API confirms have finished.
+    group them by date (all dates fetched together as date-range
+    requests, not one call per fixture or per date), and score any that
+    the API confirms have finished.
 
     Safe to run as often as you like -- get_pending_fixtures() only ever
     returns fixtures with result IS NULL, and
-    store_and_evaluate_fixture_result() re-checks that same condition
+    store_and_evaluate_fixture_results() re-checks that same condition
     atomically at write time, so a fixture already scored (by this run or
     a previous one) is never re-fetched or re-processed.
+
+    Returns {"scored": n, "matchdays": [...]} (the job queue stores it as
+    the job's result). With raise_errors=True a failed claim, scoring or
+    recompute raises instead of being reported as nothing scored.
     """
     pending = get_pending_fixtures()
     if not pending:
         logger.info("No pending fixtures to check.")
-        return
-
-    by_date = {}
-    for f in pending:
-        date_str = f["kickoff_time"][:10]
-        by_date.setdefault(date_str, []).append(f)
-
-    processed = 0
-    for date_str, fixtures in by_date.items():
-        logger.info("Checking %s pending fixture(s) for %s...", len(fixtures), date_str)
-        events = _fetch_finished_events_for_date(date_str)
-        if not events:
-            continue
-
-        for fixture in fixtures:
-            home = fixture["home_team"].lower()
-            away = fixture["away_team"].lower()
-            match = next(
-                (e for e in events
-                 if e["home"] == home and e["away"] == away and e["kickoff"].startswith(date_str)),
-                None
+        return {"scored": 0, "matchdays": []}
+
+    finished = match_finished_fixtures(pending)
+    matched = {}
+    for fixture in pending:
+        event = finished.get(fixture["fixture_id"])
+        if event:
+            matched[fixture["fixture_id"]] = (
+                fixture, f"{event['home_score']}-{event['away_score']}"
             )
-            if not match:
-                continue
-
-            result_str = f"{match['home_score']}-{match['away_score']}"
-            if store_and_evaluate_fixture_result(fixture["fixture_id"], result_str):
-                processed += 1
-                logger.info(
-                    "Scored fixture %s: %s %s %s",
-                    fixture["fixture_id"], fixture["home_team"], result_str, fixture["away_team"]
-                )
-
-    logger.info("process_pending_results: scored %s fixture(s).", processed)
+
+    # One batch claim + score for everything found this run, so each
+    # affected matchday's leaderboard is recomputed once, not once per
+    # finished fixture.
+    processed = store_and_evaluate_fixture_results(
+        ((fid, result_str) for fid, (_, result_str) in matched.items()),
+        raise_errors=raise_errors,
+    )
+    for fid in processed:
+        fixture, result_str = matched[fid]
+        logger.info(
+            "Scored fixture %s: %s %s %s",
+            fid, fixture["home_team"], result_str, fixture["away_team"]
+        )
+
+    matchdays = sorted(set(processed.values()))
+    logger.info(
+        "process_pending_results: scored %s fixture(s) across %s matchday(s).",
+        len(processed), len(matchdays),
+    )
+    return {"scored": len(processed), "matchdays": matchdays}
 
 
 if __name__ == "__main__":
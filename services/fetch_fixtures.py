@@ -1,8 +1,11 @@
 import os
 import logging
 from db import get_db
+from services.matchday_cache import invalidate_matchday_cache
+from services.treasurer import invalidate_eligibility_cache
+from services.bbc_api import fetch_events_by_date
+from services.team_names import normalize_team
 
-import requests
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
@@ -10,13 +13,17 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-BBC_API_BASE = "https://web-cdn.api.bbci.co.uk/wc-poll-data/container/sport-data-scores-fixtures"
+# Date-range requests fetched in parallel by fetch_days() when a window
+# needs more than one. Keep at or below HTTP_POOL_MAXSIZE so every thread
+# gets a kept-alive connection.
+FIXTURE_FETCH_CONCURRENCY = int(os.getenv("FIXTURE_FETCH_CONCURRENCY", "4"))
 
 # Ordered preference for Big 8 teams
 BIG_EIGHT_ORDER = [
     "Manchester United", "Arsenal", "Liverpool", "Chelsea",
     "Manchester City", "Tottenham Hotspur", "Aston Villa", "Newcastle United"
 ]
+BIG_EIGHT_RANK = {normalize_team(team): idx for idx, team in enumerate(BIG_EIGHT_ORDER)}
 
 
 def get_last_kickoff_time():
@@ -25,33 +32,11 @@ def get_last_kickoff_time():
     cursor.execute("SELECT MAX(kickoff_time) AS max_kickoff FROM fixtures")
     row = cursor.fetchone()
 
-    last_time = row['max_kickoff'] if row and row['max_kickoff'] else None
-    return datetime.fromisoformat(last_time) if last_time else None
+    return row['max_kickoff'] if row and row['max_kickoff'] else None
 
 
 def fetch_bbc_fixtures_for_day(date_str):
-    url = (
-        f"{BBC_API_BASE}?selectedStartDate={date_str}"
-        f"&selectedEndDate={date_str}"
-        f"&todayDate={datetime.today().strftime('%Y-%m-%d')}"
-        "&urn=urn%3Abbc%3Asportsdata%3Afootball%3Atournament-collection%3Acollated"
-    )
-
-    res = requests.get(url)
-    if res.status_code != 200:
-        return []
-
-    try:
-        data = res.json()
-        events = []
-        for group in data.get("eventGroups", []):
-            if group.get("displayLabel") == "Premier League":  # only EPL
-                for sec in group.get("secondaryGroups", []):
-                    events.extend(sec.get("events", []))
-        return events
-    except Exception as e:
-        logger.warning("JSON parse error: %s", e)
-        return []
+    return fetch_days([date_str])[0]
 
 
 def filter_priority_fixtures(events):
@@ -72,13 +57,13 @@ def filter_priority_fixtures(events):
         except KeyError:
             continue
 
-    # Sort fixtures based on Big 8 preference
+    # Sort fixtures based on Big 8 preference: the better-ranked of the
+    # two teams, looked up by normalized name so spelling variants count
     def preference_score(fix):
-        teams = [fix["home"], fix["away"]]
-        for idx, team in enumerate(BIG_EIGHT_ORDER):
-            if team in teams:
-                return idx
-        return len(BIG_EIGHT_ORDER) + 1  # non Big 8 go last
+        return min(
+            BIG_EIGHT_RANK.get(normalize_team(fix["home"]), len(BIG_EIGHT_ORDER) + 1),
+            BIG_EIGHT_RANK.get(normalize_team(fix["away"]), len(BIG_EIGHT_ORDER) + 1),
+        )  # non Big 8 go last
 
     fixtures.sort(key=preference_score)
 
@@ -88,15 +73,39 @@ def filter_priority_fixtures(events):
     return selected
 
 
-def try_fetch_fixtures(start_offset, range_days):
-    now = datetime.now(timezone.utc)
-    collected = []
+def fetch_days(date_strs, day_cache=None, concurrent=True):
+    """
+    Premier League events for each date, in the order given. The dates go
+    out as date-range requests (see services/bbc_api.py) -- a whole
+    fixture window is normally one call -- and windows that still need
+    separate calls run in parallel (FIXTURE_FETCH_CONCURRENCY). day_cache,
+    if passed, remembers days already fetched so an overlapping second
+    window doesn't refetch them.
+    """
+    day_cache = {} if day_cache is None else day_cache
+    missing = [d for d in dict.fromkeys(date_strs) if d not in day_cache]
+    if missing:
+        fetched = fetch_events_by_date(
+            missing, competition="Premier League",
+            max_workers=FIXTURE_FETCH_CONCURRENCY if concurrent else 1,
+        )
+        for date_str in missing:
+            # A failed request counts as "no fixtures", as it always has.
+            day_cache[date_str] = fetched.get(date_str, [])
+    return [day_cache[d] for d in date_strs]
 
-    for offset in range(start_offset, start_offset + range_days):
-        target_date = now + timedelta(days=offset)
-        date_str = target_date.strftime('%Y-%m-%d')
-        events = fetch_bbc_fixtures_for_day(date_str)
-        collected.extend(events)
+
+def try_fetch_fixtures(start_offset, range_days, day_cache=None, concurrent=True):
+    now = datetime.now(timezone.utc)
+    date_strs = [
+        (now + timedelta(days=offset)).strftime('%Y-%m-%d')
+        for offset in range(start_offset, start_offset + range_days)
+    ]
+    collected = [
+        event
+        for events in fetch_days(date_strs, day_cache, concurrent)
+        for event in events
+    ]
 
     # Get only Premier League fixtures
     pl_fixtures = [
@@ -124,7 +133,8 @@ def initialize_matchday_tracker():
     if count == 0:
         now_str = datetime.now(timezone.utc).isoformat()
         cursor.execute(
-            "INSERT INTO matchday_tracker (id, current_matchday, last_updated) VALUES (1, 0, %s)",
+            "INSERT INTO matchday_tracker (id, current_matchday, last_updated) VALUES (1, 0, %s) "
+            "ON CONFLICT (id) DO NOTHING",
             (now_str,)
         )
         conn.commit()
@@ -135,15 +145,19 @@ def get_next_matchday():
     conn = get_db()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT current_matchday FROM matchday_tracker WHERE id = 1")
-    row = cursor.fetchone()
-    current = row['current_matchday'] if row else 0
-    next_matchday = current + 1
-    if next_matchday > 38:
-        next_matchday = 1
-
-    cursor.execute("UPDATE matchday_tracker SET current_matchday = %s WHERE id = 1", (next_matchday,))
+    # One statement, so two callers can't both read N and both write N+1.
+    cursor.execute("""
+        UPDATE matchday_tracker
+        SET current_matchday = CASE WHEN COALESCE(current_matchday, 0) >= 38 THEN 1
+                                    ELSE COALESCE(current_matchday, 0) + 1 END
+        WHERE id = 1
+        RETURNING current_matchday
+    """)
+    next_matchday = cursor.fetchone()['current_matchday']
     conn.commit()
+    # Exceptions and matchdays_since_deadline are both keyed off the
+    # current matchday, so every cached eligibility is now out of date.
+    invalidate_eligibility_cache()
     logger.info("Matchday set to: %s", next_matchday)
     return next_matchday
 
@@ -164,26 +178,26 @@ def save_to_db(fixtures, matchday):
             VALUES (%s, %s, %s, %s, %s)
         ''', (fixture_id, matchday, fixture["home"], fixture["away"], fixture["kickoff"]))
     conn.commit()
+    invalidate_matchday_cache(matchday)
     logger.info("Saved %d fixtures to matchday %s.", len(fixtures), matchday)
 
 
 def collect_flexible_matchday_fixtures():
     last_kickoff = get_last_kickoff_time()
+    # Shared across the attempts below: the 16-day fallback overlaps the
+    # 4-day window, whose days are then not fetched twice.
+    day_cache = {}
 
     if last_kickoff:
         now = datetime.now(timezone.utc)
         first_offset = (last_kickoff + timedelta(days=3) - now).days + 1
         if first_offset < 0:
             first_offset = 0
-        fixtures = try_fetch_fixtures(first_offset + 1, 4)
-        if fixtures:
-            return fixtures
-
-        fixtures = try_fetch_fixtures(1, 16)
+        fixtures = try_fetch_fixtures(first_offset + 1, 4, day_cache)
         if fixtures:
             return fixtures
 
-    return try_fetch_fixtures(1, 16)
+    return try_fetch_fixtures(1, 16, day_cache)
 
 
 def is_matchday_fully_processed(matchday):
@@ -1,7 +1,8 @@
+from datetime import timezone
 from db import get_db
 
 def get_current_matchday_fixtures():
-    conn = get_db()
+    conn = get_db(readonly=True)
     cursor = conn.cursor()
 
     # Fetch the current matchday from matchday_tracker
@@ -29,7 +30,7 @@ def get_current_matchday_fixtures():
             "matchday": row['matchday'],
             "home_team": row['home_team'],
             "away_team": row['away_team'],
-            "kickoff_time": row['kickoff_time'],
+            "kickoff_time": row['kickoff_time'].astimezone(timezone.utc).isoformat(),
             "result": row['result']
         })
 
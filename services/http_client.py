@@ -0,0 +1,216 @@
+"""
+Shared outbound HTTP client for the BBC fetchers (fetch_fixtures,
+collect_results).
+
+They used to call a bare requests.get: a fresh TCP + TLS handshake on
+every call, no timeout (a hung upstream pinned a scheduler thread
+forever), and no distinction between "BBC is briefly flaky" and "BBC is
+down". Every call now goes through get_json(), which gives them:
+
+- Keep-alive: one requests.Session per process with a pooled adapter, so
+  the dozen-odd calls of a fixture or results run reuse connections.
+  Created lazily and re-created after a fork, like the DB pool.
+- Connect/read timeouts on every request (HTTP_CONNECT_TIMEOUT /
+  HTTP_READ_TIMEOUT).
+- Retries for connection errors, timeouts, 429 and 5xx, with full-jitter
+  exponential backoff (HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE).
+- A per-host circuit breaker: after HTTP_BREAKER_THRESHOLD failed calls
+  in a row the host is skipped outright for HTTP_BREAKER_COOLDOWN
+  seconds, then a single trial call decides whether to close it again.
+- Per-host latency/outcome metrics (http_metrics), served by app.py.
+
+get_json() never raises for upstream trouble: it logs and returns None,
+which is what every caller already did with a non-200.
+"""
+import bisect
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))
+HTTP_BACKOFF_MAX = 8.0
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+HTTP_BREAKER_THRESHOLD = int(os.getenv("HTTP_BREAKER_THRESHOLD", "5"))
+HTTP_BREAKER_COOLDOWN = float(os.getenv("HTTP_BREAKER_COOLDOWN", "60"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket
+# catches everything slower.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_session_lock = threading.Lock()
+_session = None
+_session_pid = None
+
+
+def _get_session():
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session_pid != pid:
+        with _session_lock:
+            if _session_pid != pid:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+                _session_pid = pid
+    return _session
+
+
+class _HostState:
+    """Circuit breaker + metrics for one upstream host. Guarded by _state_lock."""
+
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.trial_in_flight = False
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.short_circuited = 0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+
+
+_state_lock = threading.Lock()
+_hosts = {}
+
+
+def _host_state(host):
+    state = _hosts.get(host)
+    if state is None:
+        state = _hosts[host] = _HostState()
+    return state
+
+
+def _admit(host):
+    """False if the breaker for host is open. While half-open (cooldown
+    over), lets exactly one trial call through."""
+    with _state_lock:
+        state = _host_state(host)
+        if state.consecutive_failures < HTTP_BREAKER_THRESHOLD:
+            return True
+        if time.monotonic() >= state.open_until and not state.trial_in_flight:
+            state.trial_in_flight = True
+            return True
+        state.short_circuited += 1
+        return False
+
+
+def _record(host, ok, host_up, elapsed_ms, retries):
+    with _state_lock:
+        state = _host_state(host)
+        state.calls += 1
+        state.retries += retries
+        state.latency_counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        state.latency_total_ms += elapsed_ms
+        state.latency_max_ms = max(state.latency_max_ms, elapsed_ms)
+        state.trial_in_flight = False
+        if not ok:
+            state.failures += 1
+        # Only outages count towards the breaker -- a 4xx is the host
+        # answering, just not with what we wanted.
+        if host_up:
+            state.consecutive_failures = 0
+            return
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= HTTP_BREAKER_THRESHOLD:
+            state.open_until = time.monotonic() + HTTP_BREAKER_COOLDOWN
+            if state.consecutive_failures == HTTP_BREAKER_THRESHOLD:
+                logger.warning(
+                    "Circuit open for %s after %d failed calls; skipping it for %.0fs",
+                    host, state.consecutive_failures, HTTP_BREAKER_COOLDOWN,
+                )
+
+
+def _backoff(attempt):
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+def get_json(url, params=None):
+    """
+    GET url and return the decoded JSON body, or None if the call failed
+    (after retries), the body wasn't JSON, or the host's circuit is open.
+    """
+    host = urlsplit(url).netloc
+    if not _admit(host):
+        logger.warning("Circuit open for %s, skipping request", host)
+        return None
+
+    session = _get_session()
+    started = time.monotonic()
+    attempt = 0
+    data = None
+    ok = False
+    while True:
+        retryable = False
+        host_up = False
+        try:
+            response = session.get(
+                url, params=params, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+            )
+            if response.status_code == 200:
+                try:
+                    data = response.json()
+                    ok = True
+                except ValueError as e:
+                    logger.warning("Non-JSON response from %s: %s", host, e)
+                host_up = True
+            else:
+                retryable = response.status_code in RETRY_STATUSES
+                host_up = not retryable
+                logger.warning("HTTP %s from %s (params=%s)", response.status_code, host, params)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            retryable = True
+            logger.warning("Request to %s failed: %s", host, e)
+        except requests.RequestException as e:
+            # Malformed request, bad URL, etc. -- our fault, not the host's.
+            host_up = True
+            logger.warning("Request to %s failed: %s", host, e)
+
+        if ok or not retryable or attempt >= HTTP_MAX_RETRIES:
+            break
+        time.sleep(_backoff(attempt))
+        attempt += 1
+
+    elapsed_ms = (time.monotonic() - started) * 1000
+    _record(host, ok, host_up, elapsed_ms, attempt)
+    logger.debug("GET %s params=%s ok=%s retries=%d %.0fms", host, params, ok, attempt, elapsed_ms)
+    return data
+
+
+def http_metrics():
+    """Per-host call counts, latency histogram and breaker state, for this process."""
+    labels = [f"<={b}" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+    now = time.monotonic()
+    with _state_lock:
+        return {
+            host: {
+                "calls": s.calls,
+                "failures": s.failures,
+                "retries": s.retries,
+                "short_circuited": s.short_circuited,
+                "circuit": (
+                    "closed" if s.consecutive_failures < HTTP_BREAKER_THRESHOLD
+                    else "open" if now < s.open_until else "half-open"
+                ),
+                "latency_ms": dict(zip(labels, s.latency_counts)),
+                "latency_avg_ms": s.latency_total_ms / s.calls if s.calls else 0.0,
+                "latency_max_ms": s.latency_max_ms,
+            }
+            for host, s in _hosts.items()
+        }
@@ -0,0 +1,272 @@
+"""
+Postgres-backed job queue for admin-triggered background work.
+
+The admin "process pending results" / "process latest matchday" buttons
+used to run the whole BBC fetch + scoring pipeline inside the HTTP
+request, holding a waitress thread (and a pool connection) for seconds.
+They now insert a row into `jobs` and return its id straight away; the
+scheduler in every app/worker process polls the table and runs queued
+jobs (drain_jobs), and the admin polls GET /api/jobs/<id> for the outcome.
+
+Claiming uses FOR UPDATE SKIP LOCKED, so any number of processes can
+drain the same table: each claim takes a different row and none of them
+block on each other. A job whose process died mid-run is left 'running';
+requeue_stale_jobs() puts it back after JOB_STALE_AFTER_SECONDS (up to
+JOB_MAX_ATTEMPTS tries), then gives up and marks it failed. The idle
+poll itself is a read (has_queued_jobs); nothing is written until there
+is something to claim.
+
+Also home to the job_leases helpers (claim_job_lease/release_job_lease)
+the scheduler uses to run each scheduled tick once across processes.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+from db import get_db
+
+logger = logging.getLogger(__name__)
+
+JOB_STALE_AFTER_SECONDS = int(os.getenv("JOB_STALE_AFTER_SECONDS", "1800"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# How long a scheduled-job lease lasts if its holder never releases it
+# (process killed mid-run). Keep it above the longest normal run.
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "900"))
+
+
+def _process_pending_results(payload):
+    from services.collect_results import process_pending_results
+    return process_pending_results(raise_errors=True)
+
+
+def _process_latest_matchday(payload):
+    from services.predictions import process_and_evaluate_latest_matchday
+    return process_and_evaluate_latest_matchday(raise_errors=True)
+
+
+# kind -> handler(payload dict) returning a JSON-serializable result or None
+JOB_HANDLERS = {
+    "process_pending_results": _process_pending_results,
+    "process_latest_matchday": _process_latest_matchday,
+}
+
+
+def _worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def enqueue_job(kind, payload=None, created_by=None):
+    """
+    Queue a job and return (job_id, created). An identical job (same
+    kind and payload) that is still queued is returned instead of adding
+    another, so repeated clicks don't pile up duplicate pipeline runs.
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    payload_json = json.dumps(payload) if payload is not None else None
+
+    conn = get_db()
+    with conn.cursor() as cur:
+        # Serialize enqueues of this kind until commit: without it two
+        # concurrent clicks both run the SELECT before either INSERT
+        # commits, and both insert. Transaction-scoped, so it is safe
+        # through the transaction pooler. (Not a unique index on queued
+        # jobs: requeue_stale_jobs puts a running job back to 'queued'
+        # and would then collide with a newer duplicate.)
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"enqueue_job:{kind}",))
+        cur.execute(
+            """
+            SELECT id FROM jobs
+            WHERE kind = %s AND status = 'queued' AND payload IS NOT DISTINCT FROM %s
+            ORDER BY id
+            LIMIT 1
+            """,
+            (kind, payload_json),
+        )
+        row = cur.fetchone()
+        if row:
+            conn.commit()  # releases the lock
+            return row["id"], False
+
+        cur.execute(
+            "INSERT INTO jobs (kind, payload, created_by) VALUES (%s, %s, %s) RETURNING id",
+            (kind, payload_json, created_by),
+        )
+        job_id = cur.fetchone()["id"]
+    conn.commit()
+    return job_id, True
+
+
+def get_job(job_id):
+    # Primary, not get_db(readonly=True): the admin polls right after
+    # enqueueing, and a lagging replica would 404 the job it just created
+    # or report a finished one as still running.
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT id, kind, status, result, error, attempts, created_at,
+                   started_at, finished_at
+            FROM jobs WHERE id = %s
+            """,
+            (job_id,),
+        )
+        row = cur.fetchone()
+    if not row:
+        return None
+    job = dict(row)
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    for key in ("created_at", "started_at", "finished_at"):
+        if job[key] is not None:
+            job[key] = job[key].isoformat()
+    return job
+
+
+def has_queued_jobs():
+    """Cheap check the scheduler runs before claiming: one index probe
+    (idx_jobs_unfinished), no write, no commit. Read from the replica
+    when there is one -- lag only delays pickup by that much."""
+    conn = get_db(readonly=True)
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM jobs WHERE status = 'queued' LIMIT 1")
+        return cur.fetchone() is not None
+
+
+def requeue_stale_jobs():
+    """Recover jobs left 'running' by a process that died mid-job."""
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'queued' END,
+                error = CASE WHEN attempts >= %s THEN 'Abandoned by worker ' || locked_by
+                             ELSE error END,
+                finished_at = CASE WHEN attempts >= %s THEN NOW() ELSE NULL END,
+                locked_by = NULL
+            WHERE status = 'running'
+              AND started_at < NOW() - make_interval(secs => %s)
+            RETURNING id, status
+            """,
+            (JOB_MAX_ATTEMPTS, JOB_MAX_ATTEMPTS, JOB_MAX_ATTEMPTS, JOB_STALE_AFTER_SECONDS),
+        )
+        rows = cur.fetchall()
+    conn.commit()
+    for row in rows:
+        logger.warning("Stale job %s reset to %s", row["id"], row["status"])
+
+
+def claim_next_job():
+    """Atomically take the oldest queued job, or None if there isn't one."""
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = 'running', started_at = NOW(), attempts = attempts + 1,
+                locked_by = %s
+            WHERE id = (
+                SELECT id FROM jobs
+                WHERE status = 'queued'
+                ORDER BY id
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            )
+            RETURNING id, kind, payload
+            """,
+            (_worker_id(),),
+        )
+        job = cur.fetchone()
+    conn.commit()
+    return job
+
+
+def _finish_job(job_id, status, result=None, error=None):
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = %s, result = %s, error = %s, finished_at = NOW(), locked_by = NULL
+            WHERE id = %s
+            """,
+            (status, json.dumps(result) if result is not None else None, error, job_id),
+        )
+    conn.commit()
+
+
+def run_next_job():
+    """Claim and run one job. Returns False when the queue was empty."""
+    job = claim_next_job()
+    if job is None:
+        return False
+
+    logger.info("Running job %s (%s)", job["id"], job["kind"])
+    handler = JOB_HANDLERS.get(job["kind"])
+    if handler is None:
+        _finish_job(job["id"], "failed", error=f"Unknown job kind: {job['kind']}")
+        return True
+
+    try:
+        payload = json.loads(job["payload"]) if job["payload"] else {}
+        result = handler(payload)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job["id"], job["kind"])
+        get_db().rollback()
+        _finish_job(job["id"], "failed", error=str(e))
+        return True
+
+    _finish_job(job["id"], "done", result=result)
+    logger.info("Job %s (%s) done", job["id"], job["kind"])
+    return True
+
+
+def claim_job_lease(job, tick):
+    """
+    Claim the run of scheduled job `job` for schedule tick `tick` (an
+    aware datetime every process computes the same way). True if this
+    process should run it: no one holds an unexpired lease AND that tick
+    (or a later one) hasn't been claimed already -- the second check is
+    what stops a process that fires a few seconds late from re-running a
+    tick another process already finished.
+
+    A plain row update rather than a session advisory lock, so it works
+    through the transaction pooler. Committed straight away, so the
+    claim is visible to everyone else while the job runs.
+    """
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO job_leases (job, holder, lease_until, last_tick)
+            VALUES (%s, %s, NOW() + make_interval(secs => %s), %s)
+            ON CONFLICT (job) DO UPDATE SET
+                holder = EXCLUDED.holder,
+                lease_until = EXCLUDED.lease_until,
+                last_tick = EXCLUDED.last_tick
+            WHERE job_leases.lease_until < NOW()
+              AND (job_leases.last_tick IS NULL OR job_leases.last_tick < EXCLUDED.last_tick)
+            RETURNING job
+            """,
+            (job, _worker_id(), JOB_LEASE_SECONDS, tick),
+        )
+        claimed = cur.fetchone() is not None
+    conn.commit()
+    return claimed
+
+
+def release_job_lease(job):
+    """End our lease early once the run is over. Best-effort: if this
+    fails the lease simply runs out after JOB_LEASE_SECONDS."""
+    conn = get_db()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "UPDATE job_leases SET lease_until = NOW() WHERE job = %s AND holder = %s",
+                (job, _worker_id()),
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        logger.exception("Failed to release lease for %s", job)
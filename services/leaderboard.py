@@ -1,3 +1,17 @@
+"""
+Leaderboard reads.
+
+GET /api/leaderboard is the most-polled endpoint in the app, but its
+content only changes when something it's derived from changes: a
+matchday recompute, a user approved/removed, a result posted, a season
+close. Each of those calls refresh_leaderboard_snapshot(), which stores
+the fully-built response as ready-encoded JSON with a version number in
+leaderboard_snapshot. The route then serves that text as-is, with the
+version as its ETag, so an unchanged poll is a single-row PK lookup and
+a 304 -- no fixtures scan, no users/leaderboard sort, no dict rebuild.
+get_leaderboard() remains the one builder of the payload itself.
+"""
+import json
 from db import get_db
 
 def get_leaderboard():
@@ -56,4 +70,80 @@ def get_leaderboard():
         "current_matchday": current_matchday,
         "run_in": run_in,
         "leaderboard": leaderboard
-    }
\ No newline at end of file
+    }
+
+def refresh_leaderboard_snapshot(commit=True):
+    """
+    Rebuild the leaderboard payload and store it as the next snapshot
+    version. Pass commit=False to make it part of the caller's open
+    transaction (the recompute does, so the snapshot lands atomically
+    with the totals it was built from).
+
+    Best-effort, like audit logging: runs under a savepoint and swallows
+    its own errors, so a snapshot failure never undoes or breaks the
+    write that triggered it -- the route falls back to building a fresh
+    snapshot on demand when none exists.
+    """
+    conn = get_db()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SAVEPOINT leaderboard_snapshot")
+        # Lock the row BEFORE reading the totals. Building first let two
+        # refreshes race: the one that read older totals could take the
+        # row second and store them under the newer version. Holding the
+        # lock, get_leaderboard() sees everything committed by whoever
+        # held it before us. The placeholder (version 0) only exists
+        # inside this savepoint -- it is overwritten below or rolled back.
+        cursor.execute("""
+            INSERT INTO leaderboard_snapshot (id, version, payload)
+            VALUES (1, 0, '')
+            ON CONFLICT (id) DO NOTHING
+        """)
+        cursor.execute("SELECT version FROM leaderboard_snapshot WHERE id = 1 FOR UPDATE")
+        version = cursor.fetchone()["version"] + 1
+        payload = json.dumps(get_leaderboard(), separators=(",", ":"))
+        cursor.execute("""
+            UPDATE leaderboard_snapshot
+            SET version = %s, payload = %s, created_at = NOW()
+            WHERE id = 1
+        """, (version, payload))
+        cursor.execute("RELEASE SAVEPOINT leaderboard_snapshot")
+        if commit:
+            conn.commit()
+        return version, payload
+    except Exception as e:
+        try:
+            cursor.execute("ROLLBACK TO SAVEPOINT leaderboard_snapshot")
+        except Exception:
+            conn.rollback()
+        print(f"leaderboard snapshot refresh failed (non-fatal): {e}")
+        return None, None
+    finally:
+        cursor.close()
+
+
+def get_leaderboard_snapshot(known_version=None):
+    """
+    Returns (version, payload_json). payload_json is None when the stored
+    version equals known_version -- the caller already has it, so the
+    payload isn't even read off disk. Builds the first snapshot on demand
+    if none exists yet.
+    """
+    conn = get_db(readonly=True)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT version,
+               CASE WHEN version = %s THEN NULL ELSE payload END AS payload
+        FROM leaderboard_snapshot
+        WHERE id = 1
+    """, (known_version,))
+    row = cursor.fetchone()
+    cursor.close()
+    if row:
+        return row["version"], row["payload"]
+
+    version, payload = refresh_leaderboard_snapshot()
+    if version is None:
+        # Snapshot table unavailable -- serve a live build, unversioned.
+        return None, json.dumps(get_leaderboard(), separators=(",", ":"))
+    return version, payload
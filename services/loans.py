@@ -394,7 +394,7 @@ def get_user_loans(user_id):
     """A member's own loans, with derived outstanding balance and
     repayment history -- private to the owner (and the Treasurer, via a
     separate call)."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             "SELECT * FROM loans WHERE user_id = %s ORDER BY requested_at DESC",
@@ -428,7 +428,7 @@ def get_user_loans(user_id):
 def get_all_loans_for_treasurer():
     """Full visibility for the Treasurer only -- matches the plan's
     'visible only to them and the Treasurer' privacy rule."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -453,7 +453,7 @@ def get_all_loans_for_treasurer():
 def get_interest_collected():
     """Aggregate figure for the public group-fund view -- see module
     docstring for why this only counts fully repaid loans."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             "SELECT principal, interest_rate FROM loans WHERE status = 'repaid'"
@@ -0,0 +1,108 @@
+"""
+Per-process cache of each matchday's prediction-lock data: the set of
+fixture_ids in the matchday and the moment predictions lock (1 hour
+before the FIRST kickoff -- see submit_matchday_predictions for why the
+whole round locks at once).
+
+Every prediction submit used to rescan `fixtures WHERE matchday = ...`
+and re-derive the first kickoff just to rediscover those two facts, which
+only change when fixtures themselves change. In the hour before a lock
+that's the hottest read in the app, so it's served from memory instead.
+
+Invalidation is explicit: anything that writes fixtures (the scheduler's
+save_to_db, admin add_fixture, season close) calls
+invalidate_matchday_cache() after committing. That clears this process
+at once and bumps the "matchday" version in services/cache_versions.py,
+so every other process (save_to_db runs in the background worker)
+clears its copy within a couple of seconds. Entries also expire after
+MATCHDAY_CACHE_TTL_SECONDS as a backstop.
+"""
+import os
+import threading
+import time
+from datetime import timedelta
+from db import get_db
+from services.cache_versions import register_cache, bump_cache_version, sync_cache_versions
+
+PREDICTION_LOCK_BEFORE_KICKOFF = timedelta(hours=1)
+MATCHDAY_CACHE_TTL_SECONDS = int(os.getenv("MATCHDAY_CACHE_TTL_SECONDS", "300"))
+
+_cache_lock = threading.Lock()
+_by_matchday = {}   # matchday -> (frozenset(fixture_ids), lock_at, loaded_at)
+_matchday_of = {}   # fixture_id -> matchday
+
+
+def _load_matchday_for_fixture(fixture_id):
+    conn = get_db()
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT fixture_id, matchday, MIN(kickoff_time) OVER () AS first_kickoff
+            FROM fixtures
+            WHERE matchday = (SELECT matchday FROM fixtures WHERE fixture_id = %s)
+            """,
+            (fixture_id,),
+        )
+        rows = cur.fetchall()
+    if not rows:
+        return None
+
+    matchday = rows[0]["matchday"]
+    first_kickoff = rows[0]["first_kickoff"]
+    lock_at = first_kickoff - PREDICTION_LOCK_BEFORE_KICKOFF if first_kickoff else None
+    return matchday, frozenset(r["fixture_id"] for r in rows), lock_at
+
+
+def get_matchday_lock(fixture_id):
+    """
+    Returns (matchday, fixture_ids, lock_at) for the matchday containing
+    fixture_id, or None if no such fixture exists. lock_at is None when
+    no fixture in the matchday has a usable kickoff time.
+    """
+    sync_cache_versions()
+    now = time.monotonic()
+    with _cache_lock:
+        matchday = _matchday_of.get(fixture_id)
+        entry = _by_matchday.get(matchday) if matchday is not None else None
+        if entry and now - entry[2] < MATCHDAY_CACHE_TTL_SECONDS:
+            return matchday, entry[0], entry[1]
+
+    loaded = _load_matchday_for_fixture(fixture_id)
+    if loaded is None:
+        return None
+
+    matchday, fixture_ids, lock_at = loaded
+    with _cache_lock:
+        _drop_matchday(matchday)
+        _by_matchday[matchday] = (fixture_ids, lock_at, now)
+        for fid in fixture_ids:
+            _matchday_of[fid] = matchday
+    return loaded
+
+
+def _drop_matchday(matchday):
+    entry = _by_matchday.pop(matchday, None)
+    if entry:
+        for fid in entry[0]:
+            if _matchday_of.get(fid) == matchday:
+                del _matchday_of[fid]
+
+
+def _clear_local(matchday=None):
+    with _cache_lock:
+        if matchday is None:
+            _by_matchday.clear()
+            _matchday_of.clear()
+        else:
+            _drop_matchday(int(matchday))
+
+
+register_cache("matchday", _clear_local)
+
+
+def invalidate_matchday_cache(matchday=None):
+    """Forget one matchday (or everything, if matchday is None), here and
+    -- on their next version poll -- in every other process. Call after
+    committing any write that adds, removes or reschedules fixtures."""
+    _clear_local(matchday)
+    bump_cache_version("matchday")
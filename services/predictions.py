@@ -2,11 +2,13 @@
 import json
 import re
 import traceback
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+import psycopg2.extras
 from db import get_db
 from services.treasurer import get_user_eligibility
+from services.matchday_cache import get_matchday_lock
+from services.leaderboard import refresh_leaderboard_snapshot
 
-ISO_Z_RE = re.compile(r"Z$")
 SCORE_RE = re.compile(r"^\d{1,2}-\d{1,2}$")
 
 
@@ -27,12 +29,12 @@ def safe_val(r, idx=None, key=None, default=None):
     return default
 
 
-def _parse_dt(dt):
+def _iso_utc(dt):
+    """kickoff_time is a timestamptz; hand it to clients as a UTC ISO-8601
+    string, the same shape it used to be stored in as TEXT."""
     if isinstance(dt, datetime):
-        return dt
-    if isinstance(dt, str):
-        return datetime.fromisoformat(ISO_Z_RE.sub("+00:00", dt))
-    raise ValueError("Unsupported datetime format")
+        return dt.astimezone(timezone.utc).isoformat()
+    return dt
 
 
 def get_latest_completed_matchday():
@@ -72,7 +74,8 @@ def get_latest_completed_matchday():
 def submit_matchday_predictions(user_id, predictions):
     """
     predictions: list of {"fixture_id": <int|str>, "predicted_result": "x-y"}
-    Returns (True, None) on success or (False, "error msg") on failure.
+    Returns (True, {"changed": n, "unchanged": m}) on success or
+    (False, "error msg") on failure.
     """
     if not predictions:
         return False, "No predictions provided"
@@ -104,30 +107,24 @@ def submit_matchday_predictions(user_id, predictions):
         if cur.fetchone() is None:
             return False, "Invalid user_id"
 
+        # Matchday membership and lock time come from the per-process
+        # cache (services/matchday_cache.py), so deadline-spike traffic
+        # doesn't rescan fixtures on every submit.
         # infer matchday from first fixture_id
-        cur.execute("SELECT matchday FROM fixtures WHERE fixture_id = %s", (fixture_ids[0],))
-        row = cur.fetchone()
-        matchday = safe_val(row, 0, "matchday")
-        if matchday is None:
+        lock_info = get_matchday_lock(fixture_ids[0])
+        if lock_info is None:
             return False, "Invalid fixture_id"
-
-        # fetch provided fixtures and verify they exist
-        cur.execute(
-            "SELECT fixture_id, kickoff_time, matchday FROM fixtures WHERE fixture_id = ANY(%s)",
-            (fixture_ids,),
-        )
-        rows = cur.fetchall()
-        if len(rows) != len(fixture_ids):
-            return False, "Unknown fixture_id(s)"
-
-        # ensure all provided fixtures are for the same matchday
-        if any(safe_val(r, 2, "matchday") != matchday for r in rows):
+        matchday, required_ids, lock_at = lock_info
+
+        stray_ids = [fid for fid in fixture_ids if fid not in required_ids]
+        if stray_ids:
+            # Error path only: work out whether the strays don't exist at
+            # all or belong to some other matchday.
+            if any(get_matchday_lock(fid) is None for fid in stray_ids):
+                return False, "Unknown fixture_id(s)"
             return False, "All predictions must be for one matchday"
 
         # ensure all fixtures for the matchday are present in submission
-        cur.execute("SELECT fixture_id, kickoff_time FROM fixtures WHERE matchday = %s", (matchday,))
-        all_rows = cur.fetchall()
-        required_ids = {safe_val(r, 0, "fixture_id") for r in all_rows}
         if set(fixture_ids) != required_ids:
             return False, "Must submit ALL fixtures in matchday"
 
@@ -139,18 +136,8 @@ def submit_matchday_predictions(user_id, predictions):
         # fixture's own kickoff - 30 minutes individually, which let
         # later fixtures stay editable after the round had already
         # effectively started.)
-        first_kickoff = None
-        for r in all_rows:
-            k = safe_val(r, 1, "kickoff_time")
-            try:
-                dt = _parse_dt(k)
-            except Exception:
-                dt = None
-            if dt and (first_kickoff is None or dt < first_kickoff):
-                first_kickoff = dt
-
         now_utc = datetime.now(timezone.utc)
-        if not first_kickoff or now_utc > first_kickoff - timedelta(hours=1):
+        if not lock_at or now_utc > lock_at:
             return False, "Predictions are closed for this matchday"
 
         # Upsert: ON CONFLICT makes this atomic, so two concurrent
@@ -159,21 +146,30 @@ def submit_matchday_predictions(user_id, predictions):
         # two rows -- the DB-level unique constraint on (user_id,
         # fixture_id) is what actually closes that race; this just makes
         # the normal edit-a-prediction path use it instead of a
-        # SELECT-then-branch that had the same race built in.
-        for p in predictions:
-            fid, pr = int(p["fixture_id"]), p["predicted_result"]
-            cur.execute(
-                """
-                INSERT INTO predictions (user_id, fixture_id, predicted_result)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (user_id, fixture_id)
-                DO UPDATE SET predicted_result = EXCLUDED.predicted_result
-                """,
-                (user_id, fid, pr),
-            )
+        # SELECT-then-branch that had the same race built in. All rows go
+        # in one multi-row statement rather than one INSERT per fixture.
+        # The DO UPDATE ... WHERE skips rows whose score didn't change:
+        # users resubmit the whole form many times before the deadline,
+        # usually editing one score or none, and rewriting identical rows
+        # just churned dead tuples/WAL on predictions. RETURNING only
+        # reports rows actually inserted or updated.
+        written = psycopg2.extras.execute_values(
+            cur,
+            """
+            INSERT INTO predictions (user_id, fixture_id, predicted_result)
+            VALUES %s
+            ON CONFLICT (user_id, fixture_id)
+            DO UPDATE SET predicted_result = EXCLUDED.predicted_result
+            WHERE predictions.predicted_result IS DISTINCT FROM EXCLUDED.predicted_result
+            RETURNING fixture_id
+            """,
+            [(user_id, int(p["fixture_id"]), p["predicted_result"]) for p in predictions],
+            fetch=True,
+        )
 
         db.commit()
-        return True, None
+        changed = len(written)
+        return True, {"changed": changed, "unchanged": len(predictions) - changed}
     except Exception as e:
         db.rollback()
         print("Prediction insert error:", e)
@@ -191,7 +187,7 @@ def get_user_predictions(user_id):
     Return predictions for the latest matchday (list with one dict) if the user has predictions,
     otherwise return [].
     """
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         cur.execute("SELECT MAX(matchday) AS max_matchday FROM fixtures")
@@ -226,7 +222,7 @@ def get_user_predictions(user_id):
                 "fixture_id": safe_val(r, 1, "fixture_id"),
                 "home_team": safe_val(r, 2, "home_team"),
                 "away_team": safe_val(r, 3, "away_team"),
-                "kickoff_time": safe_val(r, 4, "kickoff_time"),
+                "kickoff_time": _iso_utc(safe_val(r, 4, "kickoff_time")),
                 "predicted_result": safe_val(r, 5, "predicted_result"),
                 "final_result": safe_val(r, 7, "final_result"),
                 "points": safe_val(r, 6, "points_awarded", 0) or 0
@@ -245,7 +241,7 @@ def get_user_predictions(user_id):
 
 
 def get_predictions_by_matchday(matchday):
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         cur.execute("""
@@ -280,8 +276,11 @@ def update_fixture_result(fixture_id, actual_result):
     cur = db.cursor()
     try:
         cur.execute("UPDATE fixtures SET result = %s WHERE fixture_id = %s", (actual_result, fixture_id))
+        updated = cur.rowcount > 0
         db.commit()
-        return cur.rowcount > 0
+        if updated:
+            refresh_leaderboard_snapshot()
+        return updated
     except Exception as e:
         db.rollback()
         print("Fixture update error:", e)
@@ -294,51 +293,81 @@ def update_fixture_result(fixture_id, actual_result):
             pass
 
 
-def evaluate_predictions(fixture_id):
+def score_fixtures(fixture_ids, commit=True):
     """
-    For a given fixture_id, fetch the actual result from fixtures, compute points,
-    and update predictions table with points_awarded and final_result.
+    Score every prediction for the given fixtures in ONE set-based
+    statement: exact score = 5, correct outcome (win/draw/lose) = 2,
+    anything else (including a missing/malformed prediction) = 0.
+
+    Only fixtures whose stored result is a real "x-y" score are touched --
+    a NULL result or the 'null' cancelled marker is skipped, same as the
+    old per-row loop did. Previously this was one UPDATE per prediction
+    row, i.e. hundreds of round trips through the pooler every time a
+    fixture settled; now it's one, however many fixtures/members there are.
+
+    Returns {fixture_id: predictions_scored} for every settled fixture in
+    the input (0 if nobody predicted it), or None on failure.
+
+    Pass commit=False to score inside the caller's open transaction (the
+    batch claim does, so a fixture's result and its predictions' points
+    commit together); errors then propagate and the rollback is the
+    caller's.
     """
+    try:
+        fixture_ids = [int(fid) for fid in fixture_ids]
+    except Exception:
+        return None
+    if not fixture_ids:
+        return {}
+
     db = get_db()
     cur = db.cursor()
     try:
-        cur.execute("SELECT result FROM fixtures WHERE fixture_id = %s", (fixture_id,))
-        actual_result = safe_val(cur.fetchone(), 0, "result")
-        if not actual_result:
-            return False
-
-        try:
-            actual_home, actual_away = map(int, str(actual_result).split("-"))
-        except Exception:
-            return False
-
-        cur.execute("SELECT id, predicted_result FROM predictions WHERE fixture_id = %s", (fixture_id,))
-        predictions = cur.fetchall()
-
-        for pr in predictions:
-            prediction_id = safe_val(pr, 0, "id")
-            predicted_result = safe_val(pr, 1, "predicted_result")
-            points = 0
-            if predicted_result:
-                try:
-                    pred_home, pred_away = map(int, str(predicted_result).split("-"))
-                    # exact score
-                    if pred_home == actual_home and pred_away == actual_away:
-                        points = 5
-                    # correct outcome (win/draw/lose)
-                    elif ((pred_home - pred_away) * (actual_home - actual_away) > 0) or (pred_home == pred_away and actual_home == actual_away):
-                        points = 2
-                except Exception:
-                    pass
-            cur.execute("UPDATE predictions SET points_awarded=%s, final_result=%s WHERE id=%s",
-                        (points, actual_result, prediction_id))
-        db.commit()
-        return True
+        cur.execute("""
+            WITH settled AS (
+                SELECT fixture_id, result,
+                       split_part(result, '-', 1)::int AS actual_home,
+                       split_part(result, '-', 2)::int AS actual_away
+                FROM fixtures
+                WHERE fixture_id = ANY(%s)
+                  AND result ~ '^[0-9]+-[0-9]+$'
+            ),
+            scored AS (
+                UPDATE predictions p
+                SET points_awarded = CASE
+                        WHEN p.predicted_result IS NULL
+                             OR p.predicted_result !~ '^[0-9]+-[0-9]+$' THEN 0
+                        WHEN split_part(p.predicted_result, '-', 1)::int = s.actual_home
+                             AND split_part(p.predicted_result, '-', 2)::int = s.actual_away THEN 5
+                        WHEN sign(split_part(p.predicted_result, '-', 1)::int
+                                  - split_part(p.predicted_result, '-', 2)::int)
+                             = sign(s.actual_home - s.actual_away) THEN 2
+                        ELSE 0
+                    END,
+                    final_result = s.result
+                FROM settled s
+                WHERE p.fixture_id = s.fixture_id
+                RETURNING p.fixture_id
+            )
+            SELECT s.fixture_id, COUNT(sc.fixture_id) AS scored
+            FROM settled s
+            LEFT JOIN scored sc ON sc.fixture_id = s.fixture_id
+            GROUP BY s.fixture_id
+        """, (fixture_ids,))
+        counts = {
+            safe_val(r, 0, "fixture_id"): safe_val(r, 1, "scored", 0) or 0
+            for r in cur.fetchall()
+        }
+        if commit:
+            db.commit()
+        return counts
     except Exception as e:
+        if not commit:
+            raise
         db.rollback()
         print("Prediction evaluation error:", e)
         traceback.print_exc()
-        return False
+        return None
     finally:
         try:
             cur.close()
@@ -346,6 +375,21 @@ def evaluate_predictions(fixture_id):
             pass
 
 
+def evaluate_predictions(fixture_id):
+    """
+    Single-fixture wrapper around score_fixtures(), kept for the admin
+    post-result route. True if the fixture had a usable result and its
+    predictions were scored.
+    """
+    counts = score_fixtures([fixture_id])
+    if not counts:
+        return False
+    try:
+        return int(fixture_id) in counts
+    except Exception:
+        return False
+
+
 def _recompute_matchday_and_leaderboard(matchday):
     """
     Recompute matchday_results and leaderboard totals for one matchday.
@@ -365,43 +409,49 @@ def _recompute_matchday_and_leaderboard(matchday):
     db = get_db()
     cur = db.cursor()
     try:
+        # Both steps are set-based and share one transaction: a constant
+        # two statements per recompute, however many members predicted,
+        # instead of an upsert + SUM + upsert round trip per user. Readers
+        # never see matchday_results updated but leaderboard not yet.
         cur.execute("""
-            SELECT p.user_id, SUM(CASE WHEN p.points_awarded IS NOT NULL THEN p.points_awarded ELSE 0 END) AS total_points
+            INSERT INTO matchday_results (matchday, user_id, points)
+            SELECT f.matchday, p.user_id, SUM(COALESCE(p.points_awarded, 0))
             FROM predictions p
             JOIN fixtures f ON p.fixture_id = f.fixture_id
             WHERE f.matchday = %s
-            GROUP BY p.user_id
+            GROUP BY f.matchday, p.user_id
+            ON CONFLICT (matchday, user_id) DO UPDATE
+            SET points = EXCLUDED.points
         """, (matchday,))
-        user_points = cur.fetchall()
-
-        for up in user_points:
-            user_id = safe_val(up, 0, "user_id")
-            total_points = safe_val(up, 1, "total_points", 0) or 0
-            cur.execute("""
-                INSERT INTO matchday_results (matchday, user_id, points)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (matchday, user_id) DO UPDATE
-                SET points = EXCLUDED.points
-            """, (matchday, user_id, total_points))
-        db.commit()
 
-        for up in user_points:
-            user_id = safe_val(up, 0, "user_id")
-            cur.execute("SELECT SUM(points) AS total FROM matchday_results WHERE user_id = %s", (user_id,))
-            total_points = safe_val(cur.fetchone(), 0, "total", 0) or 0
-            # GREATEST guards current_matchday from moving backwards: with
-            # postponed/rescheduled fixtures, an earlier matchday can settle
-            # after a later one already has. Without this, whichever
-            # recompute happens to run last would silently drag the
-            # displayed "current matchday" backwards.
-            cur.execute("""
-                INSERT INTO leaderboard (user_id, points, current_matchday, last_updated)
-                VALUES (%s, %s, %s, NOW())
-                ON CONFLICT(user_id) DO UPDATE SET
-                    points = EXCLUDED.points,
-                    current_matchday = GREATEST(leaderboard.current_matchday, EXCLUDED.current_matchday),
-                    last_updated = EXCLUDED.last_updated
-            """, (user_id, total_points, matchday))
+        # Season totals are re-summed from matchday_results for exactly
+        # the users who predicted in this matchday -- same population the
+        # old per-user loop covered.
+        # GREATEST guards current_matchday from moving backwards: with
+        # postponed/rescheduled fixtures, an earlier matchday can settle
+        # after a later one already has. Without this, whichever
+        # recompute happens to run last would silently drag the
+        # displayed "current matchday" backwards.
+        cur.execute("""
+            INSERT INTO leaderboard (user_id, points, current_matchday, last_updated)
+            SELECT mr.user_id, SUM(mr.points), %s, NOW()
+            FROM matchday_results mr
+            WHERE mr.user_id IN (
+                SELECT p.user_id
+                FROM predictions p
+                JOIN fixtures f ON p.fixture_id = f.fixture_id
+                WHERE f.matchday = %s
+            )
+            GROUP BY mr.user_id
+            ON CONFLICT(user_id) DO UPDATE SET
+                points = EXCLUDED.points,
+                current_matchday = GREATEST(leaderboard.current_matchday, EXCLUDED.current_matchday),
+                last_updated = EXCLUDED.last_updated
+        """, (matchday, matchday))
+
+        # Publish the new standings as the served leaderboard snapshot in
+        # the same transaction (see services/leaderboard.py).
+        refresh_leaderboard_snapshot(commit=False)
         db.commit()
         return True
     except Exception as e:
@@ -416,65 +466,119 @@ def _recompute_matchday_and_leaderboard(matchday):
             pass
 
 
-def store_and_evaluate_fixture_result(fixture_id, result_str):
+def store_and_evaluate_fixture_results(results, raise_errors=False):
     """
-    Process ONE fixture as soon as its full-time result is available --
-    the per-fixture counterpart to process_and_evaluate_latest_matchday's
-    whole-matchday batch.
+    Batch ingest: claim, score and recompute a whole scheduler run's worth
+    of finished fixtures at once.
 
-    Idempotency/race-safety: the UPDATE below only touches the fixture if
-    its result is still NULL. If two calls ever race for the same fixture
-    (overlapping scheduler runs, a manual admin action landing at the same
-    time), only the first one gets rowcount > 0 and proceeds; the second
-    sees rowcount == 0 and stops immediately -- so a fixture can never be
-    evaluated/scored twice, enforced at the database level rather than by
-    an application-side check-then-act that has a gap in it.
+    results: iterable of (fixture_id, "x-y") pairs.
 
-    Returns True if this call is the one that actually processed the
-    fixture, False if it was already done (or the fixture doesn't exist).
+    Idempotency/race-safety: the claim UPDATE below only touches fixtures
+    whose result is still NULL, and RETURNING tells us exactly which rows
+    this call won. If two calls ever race for the same fixture
+    (overlapping scheduler runs, a manual admin action landing at the same
+    time), only one of them gets it back from RETURNING; the other simply
+    doesn't see it -- so a fixture can never be evaluated/scored twice,
+    enforced at the database level rather than by an application-side
+    check-then-act that has a gap in it.
+
+    Everything claimed is scored by one score_fixtures() call in the SAME
+    transaction as the claim: if scoring fails the claim rolls back too,
+    so the fixture's result stays NULL and the next run picks it up
+    again. (Committing the claim first left a fixture with a result but
+    unscored predictions that `result IS NULL` would never revisit.)
+    Each affected matchday is then recomputed exactly ONCE, however many
+    of its fixtures finished in this batch -- a Saturday with six
+    finished games used to rebuild the whole leaderboard six times.
+
+    Returns {fixture_id: matchday} for the fixtures this call actually
+    processed (empty if they were all already done or don't exist).
+    Database errors are logged and swallowed -- the claim or recompute is
+    simply retried by a later run -- unless raise_errors=True, which the
+    admin job queue passes so a failed run is recorded as failed.
     """
+    pairs = {}
+    for fixture_id, result_str in results:
+        pairs[int(fixture_id)] = result_str
+    if not pairs:
+        return {}
+
     db = get_db()
     cur = db.cursor()
     try:
-        cur.execute(
-            "UPDATE fixtures SET result = %s WHERE fixture_id = %s AND result IS NULL",
-            (result_str, fixture_id),
+        claimed_rows = psycopg2.extras.execute_values(
+            cur,
+            """
+            UPDATE fixtures f SET result = v.result
+            FROM (VALUES %s) AS v (fixture_id, result)
+            WHERE f.fixture_id = v.fixture_id AND f.result IS NULL
+            RETURNING f.fixture_id, f.matchday
+            """,
+            list(pairs.items()),
+            fetch=True,
         )
-        claimed = cur.rowcount > 0
-        if not claimed:
-            db.rollback()
-            return False
-
-        cur.execute(
-            "UPDATE predictions SET final_result = %s WHERE fixture_id = %s",
-            (result_str, fixture_id),
-        )
-        cur.execute("SELECT matchday FROM fixtures WHERE fixture_id = %s", (fixture_id,))
-        matchday = safe_val(cur.fetchone(), 0, "matchday")
+        claimed = {
+            safe_val(r, 0, "fixture_id"): safe_val(r, 1, "matchday")
+            for r in claimed_rows
+        }
+        # Also stamps predictions.final_result, in the same statement as
+        # the points.
+        counts = score_fixtures(list(claimed), commit=False) if claimed else {}
         db.commit()
     except Exception as e:
         db.rollback()
-        print(f"Error storing result for fixture {fixture_id}:", e)
+        print(f"Error storing/scoring results for fixtures {sorted(pairs)}:", e)
         traceback.print_exc()
-        return False
+        if raise_errors:
+            raise
+        return {}
     finally:
         try:
             cur.close()
         except Exception:
             pass
 
-    evaluate_predictions(fixture_id)
+    if not claimed:
+        return {}
+
+    for fid in sorted(claimed):
+        print(f"Scored {counts.get(fid, 0)} prediction(s) for fixture {fid}.")
+
+    failed = [
+        matchday
+        for matchday in sorted({md for md in claimed.values() if md is not None})
+        if not _recompute_matchday_and_leaderboard(matchday)
+    ]
+    if failed and raise_errors:
+        raise RuntimeError(f"Leaderboard recompute failed for matchday(s) {failed}")
+
+    return claimed
 
-    if matchday is not None:
-        _recompute_matchday_and_leaderboard(matchday)
 
-    return True
+def store_and_evaluate_fixture_result(fixture_id, result_str):
+    """
+    Process ONE fixture as soon as its full-time result is available --
+    the single-fixture form of store_and_evaluate_fixture_results (see
+    there for the claim-based race safety).
+
+    Returns True if this call is the one that actually processed the
+    fixture, False if it was already done (or the fixture doesn't exist).
+    """
+    try:
+        fixture_id = int(fixture_id)
+    except Exception:
+        return False
+    return fixture_id in store_and_evaluate_fixture_results([(fixture_id, result_str)])
 
 
-def process_and_evaluate_latest_matchday():
+def process_and_evaluate_latest_matchday(raise_errors=False):
     """
     Loads stored results for the latest completed matchday, updates fixtures,
     evaluates predictions, records matchday_results and updates leaderboard.
+
+    Returns a summary dict, or None if no matchday was ready. Errors are
+    logged and swallowed unless raise_errors=True -- the admin job queue
+    passes it so a failed run is recorded as failed, not done.
     """
     db = get_db()
     cur = db.cursor()
@@ -497,7 +601,6 @@ def process_and_evaluate_latest_matchday():
             results = []
 
         updated_count = 0
-        evaluated_count = 0
 
         for item in results:
             home = item.get("home")
@@ -507,7 +610,8 @@ def process_and_evaluate_latest_matchday():
             if score.get("home") is None or score.get("away") is None:
                 continue
             result_str = f"{score['home']}-{score['away']}"
-            # Update by home/away/kickoff_time; ensure types match DB storage
+            # Update by home/away/kickoff_time; the stored ISO string is cast
+            # to timestamptz by Postgres for the comparison
             cur.execute(
                 "UPDATE fixtures SET result = %s WHERE home_team = %s AND away_team = %s AND kickoff_time = %s",
                 (result_str, home, away, kickoff))
@@ -523,9 +627,12 @@ def process_and_evaluate_latest_matchday():
         cur.execute("SELECT fixture_id FROM fixtures WHERE matchday = %s", (matchday,))
         fixture_ids = [safe_val(r, 0, "fixture_id") for r in cur.fetchall()]
 
-        for fid in fixture_ids:
-            if evaluate_predictions(fid):
-                evaluated_count += 1
+        counts = score_fixtures(fixture_ids)
+        if counts is None:
+            if raise_errors:
+                raise RuntimeError(f"Scoring predictions failed for matchday {matchday}")
+            counts = {}
+        evaluated_count = len(counts)
 
         print(f"Updated {updated_count} fixture results.")
         print(f"Marked {cancelled_count} matches as cancelled/null.")
@@ -535,12 +642,21 @@ def process_and_evaluate_latest_matchday():
         # per-fixture path so both stay in sync (see
         # _recompute_matchday_and_leaderboard for why this is safe to
         # call repeatedly / after partial data).
-        if _recompute_matchday_and_leaderboard(matchday):
-            print(f"Leaderboard updated for matchday {matchday}.")
+        if not _recompute_matchday_and_leaderboard(matchday):
+            raise RuntimeError(f"Leaderboard recompute failed for matchday {matchday}")
+        print(f"Leaderboard updated for matchday {matchday}.")
+        return {
+            "matchday": matchday,
+            "updated": updated_count,
+            "cancelled": cancelled_count,
+            "evaluated": evaluated_count,
+        }
     except Exception as e:
         db.rollback()
         print("Error processing latest matchday:", e)
         traceback.print_exc()
+        if raise_errors:
+            raise
     finally:
         try:
             cur.close()
@@ -549,7 +665,7 @@ def process_and_evaluate_latest_matchday():
 
 
 def get_final_round_results():
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         cur.execute("SELECT MAX(matchday) AS latest_matchday FROM matchday_results")
@@ -591,7 +707,7 @@ def get_user_matchday_performance(user_id, matchday):
     - total points for the matchday
     - rank among all users for that matchday
     """
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         # 1️⃣ Fetch fixture-level predictions
@@ -615,7 +731,7 @@ def get_user_matchday_performance(user_id, matchday):
             fixtures.append({
                 "home_team": safe_val(r, 0, "home_team"),
                 "away_team": safe_val(r, 1, "away_team"),
-                "kickoff_time": safe_val(r, 2, "kickoff_time"),
+                "kickoff_time": _iso_utc(safe_val(r, 2, "kickoff_time")),
                 "predicted_result": safe_val(r, 3, "predicted_result"),
                 "final_result": safe_val(r, 4, "final_result"),
                 "points": points
@@ -653,7 +769,7 @@ def get_previous_matchday_performance(user_id):
     """
     Returns performance for the previous matchday
     """
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         # Convert user_id to integer for consistency
@@ -727,7 +843,7 @@ def get_previous_matchday_performance(user_id):
                 "fixture_id": safe_val(r, 0, "fixture_id"),
                 "home_team": safe_val(r, 1, "home_team"),
                 "away_team": safe_val(r, 2, "away_team"),
-                "kickoff_time": safe_val(r, 3, "kickoff_time"),
+                "kickoff_time": _iso_utc(safe_val(r, 3, "kickoff_time")),
                 "predicted_result": safe_val(r, 4, "predicted_result"),
                 "final_result": safe_val(r, 5, "final_result"),
                 "points": points
@@ -756,7 +872,7 @@ def get_latest_completed_user_predictions(user_id):
     """
     Return the user's performance for the latest completed matchday (fixtures with result IS NOT NULL).
     """
-    db = get_db()
+    db = get_db(readonly=True)
     cur = db.cursor()
     try:
         cur.execute("SELECT MAX(matchday) AS latest_matchday FROM fixtures WHERE result IS NOT NULL")
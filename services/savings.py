@@ -297,7 +297,7 @@ def process_week_rollover():
 # ---------- Config history & audit ----------
 
 def get_savings_config_history():
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -330,7 +330,7 @@ def get_user_ledger(user_id):
     """Personal ledger: every transaction the user submitted, plus a
     running savings balance after each confirmed one, plus their
     surcharge weeks."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -388,7 +388,7 @@ def get_total_savings_balance():
     """Grand total across every member's confirmed savings -- the figure
     that should tally against physical/mobile cash on hand, growing over
     time as more gets confirmed. Never stored, always derived."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             "SELECT COALESCE(SUM(allocated_savings), 0) AS total FROM savings_transactions WHERE status = 'confirmed'"
@@ -401,7 +401,7 @@ def get_members_savings_overview():
     surcharge still owed -- the collapsed-row view for the Treasurer/
     Secretary cash-reconciliation roster, before drilling into any one
     member's full history."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             "SELECT id, username, full_name FROM users WHERE is_approved = 1 ORDER BY username"
@@ -437,7 +437,7 @@ def get_members_savings_overview():
 def get_surcharge_pool():
     """Public view: who owes what (and since when), plus group totals.
     Deliberately public per the plan -- shared-fund transparency."""
-    conn = get_db()
+    conn = get_db(readonly=True)
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -28,6 +28,9 @@ import csv
 import io
 from db import get_db
 from services.audit import log_action
+from services.matchday_cache import invalidate_matchday_cache
+from services.treasurer import invalidate_eligibility_cache
+from services.leaderboard import refresh_leaderboard_snapshot
 
 
 def _generate_export_csv(cur):
@@ -187,6 +190,9 @@ def close_season(triggered_by_user_id):
         print(f"Season wipe failed after a successful export (export id {export_id} is safe): {e}")
         return False, f"Wipe failed after export succeeded (export #{export_id} is safe) -- {e}", export_id
 
+    invalidate_matchday_cache()
+    invalidate_eligibility_cache()
+    refresh_leaderboard_snapshot()
     log_action(triggered_by_user_id, 'season_close', 'season_export', export_id)
     return True, None, export_id
 
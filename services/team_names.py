@@ -0,0 +1,65 @@
+"""
+Team-name normalization for matching our fixtures against BBC events.
+
+Matching used to compare lowercased names exactly, so any spelling
+difference -- an admin-entered "Spurs" or "Man Utd" (admin add_fixture),
+"Brighton & Hove Albion" vs "Brighton and Hove Albion", "AFC Bournemouth"
+vs "Bournemouth" -- silently failed to match and the fixture was never
+scored. normalize_team() maps every known variant to one canonical key.
+Add to TEAM_ALIASES when a new variant turns up.
+"""
+import re
+
+# normalized variant -> canonical key (keys and values already in the
+# form _clean() produces)
+TEAM_ALIASES = {
+    "man utd": "manchester united",
+    "man united": "manchester united",
+    "manchester utd": "manchester united",
+    "man city": "manchester city",
+    "spurs": "tottenham hotspur",
+    "tottenham": "tottenham hotspur",
+    "newcastle": "newcastle united",
+    "newcastle utd": "newcastle united",
+    "wolves": "wolverhampton wanderers",
+    "wolverhampton": "wolverhampton wanderers",
+    "brighton": "brighton and hove albion",
+    "brighton hove albion": "brighton and hove albion",
+    "west ham": "west ham united",
+    "west ham utd": "west ham united",
+    "nottm forest": "nottingham forest",
+    "notts forest": "nottingham forest",
+    "forest": "nottingham forest",
+    "villa": "aston villa",
+    "leeds": "leeds united",
+    "leeds utd": "leeds united",
+    "sheffield utd": "sheffield united",
+    "sheff utd": "sheffield united",
+    "palace": "crystal palace",
+    "leicester": "leicester city",
+    "ipswich": "ipswich town",
+    "luton": "luton town",
+    "norwich": "norwich city",
+    "west brom": "west bromwich albion",
+}
+
+_PUNCTUATION = re.compile(r"[.'’]")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def _clean(name):
+    name = (name or "").lower().replace("&", " and ")
+    name = _PUNCTUATION.sub("", name)
+    words = _NON_WORD.sub(" ", name).split()
+    # "AFC Bournemouth", "Fulham FC" -> "bournemouth", "fulham"
+    while words and words[0] in ("afc", "fc"):
+        words.pop(0)
+    while words and words[-1] in ("afc", "fc"):
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_team(name):
+    """Canonical matching key for a team name."""
+    cleaned = _clean(name)
+    return TEAM_ALIASES.get(cleaned, cleaned)
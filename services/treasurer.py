@@ -15,9 +15,29 @@ deadline first came due". From then on:
     stops applying as soon as current_matchday moves past that.
   - once matchdays_since_deadline > 2, the grant endpoint itself refuses
     to create a new exception, even for the Treasurer.
+
+Eligibility is checked on every prediction submit, but its inputs (fee
+config, paid status, exceptions, current matchday) change rarely, so
+results are cached per user in-process. Every write to those inputs
+invalidates: mark_paid / grant_exception for that user, set_fee_config,
+matchday advancement and season close for everyone. A pre-deadline
+result also expires at the deadline itself, since crossing it changes
+the answer without any write happening. Invalidations reach the other
+processes (web workers, the background worker) through the
+"eligibility" version in services/cache_versions.py within a couple of
+seconds; the TTL is only a backstop if that fails.
 """
-from datetime import datetime, timezone
+import os
+import threading
+from datetime import datetime, timedelta, timezone
 from db import get_db
+from services.cache_versions import register_cache, bump_cache_version, sync_cache_versions
+
+ELIGIBILITY_CACHE_TTL_SECONDS = int(os.getenv("ELIGIBILITY_CACHE_TTL_SECONDS", "300"))
+
+_eligibility_lock = threading.Lock()
+_eligibility_cache = {}   # user_id -> (result dict, expires_at)
+_eligibility_generation = 0   # bumped on every invalidation
 
 
 def _now():
@@ -56,6 +76,27 @@ def _ensure_deadline_matchday_captured(cur, config):
     return cur.fetchone()
 
 
+def _clear_local_eligibility(user_id=None):
+    global _eligibility_generation
+    with _eligibility_lock:
+        _eligibility_generation += 1
+        if user_id is None:
+            _eligibility_cache.clear()
+        else:
+            _eligibility_cache.pop(user_id, None)
+
+
+register_cache("eligibility", _clear_local_eligibility)
+
+
+def invalidate_eligibility_cache(user_id=None):
+    """Drop one user's cached eligibility, or everyone's if user_id is None.
+    Other processes drop their whole eligibility cache on their next
+    version poll. Call after committing the write."""
+    _clear_local_eligibility(user_id)
+    bump_cache_version("eligibility")
+
+
 # ---------- Treasurer role grant/revoke (admin action) ----------
 
 def set_treasurer(username, is_treasurer):
@@ -98,7 +139,8 @@ def set_fee_config(amount, deadline_iso, set_by_user_id):
         )
         row = cur.fetchone()
         conn.commit()
-        return row
+    invalidate_eligibility_cache()
+    return row
 
 
 def get_active_fee_config():
@@ -145,7 +187,8 @@ def mark_paid(user_id, has_paid, confirmed_by_user_id):
             (user_id, bool(has_paid), confirmed_by_user_id),
         )
         conn.commit()
-        return True
+    invalidate_eligibility_cache(user_id)
+    return True
 
 
 # ---------- Exceptions ----------
@@ -177,7 +220,8 @@ def grant_exception(user_id, granted_by_user_id):
         )
         row = cur.fetchone()
         conn.commit()
-        return True, row
+    invalidate_eligibility_cache(user_id)
+    return True, row
 
 
 def get_exceptions_log():
@@ -220,19 +264,38 @@ def get_user_eligibility(user_id):
        exception_active: bool, matchdays_since_deadline: int|None}
     A user with no fee configured at all is always eligible (nothing to
     gate against yet).
+
+    Served from the per-user cache when possible (see module docstring);
+    a cache hit costs no queries beyond the periodic version poll.
     """
+    sync_cache_versions()
+    now = _now()
+    with _eligibility_lock:
+        cached = _eligibility_cache.get(user_id)
+        if cached and now < cached[1]:
+            return dict(cached[0])
+        generation = _eligibility_generation
+
+    result, deadline = _compute_user_eligibility(user_id)
+
+    expires_at = now + timedelta(seconds=ELIGIBILITY_CACHE_TTL_SECONDS)
+    if deadline is not None and not result["deadline_passed"]:
+        expires_at = min(expires_at, deadline)
+    with _eligibility_lock:
+        # An invalidation that landed mid-compute means this result may
+        # already be stale -- return it, but don't cache it.
+        if generation == _eligibility_generation:
+            _eligibility_cache[user_id] = (result, expires_at)
+    return dict(result)
+
+
+def _compute_user_eligibility(user_id):
+    """Uncached eligibility evaluation. Returns (result, fee deadline or None)."""
     conn = get_db()
     with conn.cursor() as cur:
         config = _get_active_config(cur)
         if config is None:
-            return {
-                "eligible": True,
-                "reason": "No commitment fee configured",
-                "has_paid": None,
-                "deadline_passed": False,
-                "exception_active": False,
-                "matchdays_since_deadline": None,
-            }
+            return _decide_eligibility(None, False), None
 
         config = _ensure_deadline_matchday_captured(cur, config)
         conn.commit()
@@ -243,59 +306,138 @@ def get_user_eligibility(user_id):
         row = cur.fetchone()
         has_paid = bool(row["has_paid"]) if row else False
 
-        deadline_passed = _now() >= config["deadline"]
-
-        if has_paid:
-            return {
-                "eligible": True,
-                "reason": "Paid",
-                "has_paid": True,
-                "deadline_passed": deadline_passed,
-                "exception_active": False,
-                "matchdays_since_deadline": None,
-            }
-
-        if not deadline_passed:
-            return {
-                "eligible": True,
-                "reason": "Grace period -- before deadline",
-                "has_paid": False,
-                "deadline_passed": False,
-                "exception_active": False,
-                "matchdays_since_deadline": None,
-            }
+        # Current matchday / exceptions only matter for an unpaid user
+        # past the deadline -- don't query them otherwise.
+        current_matchday = None
+        exception_active = False
+        if not has_paid and _now() >= config["deadline"]:
+            current_matchday = _current_matchday(cur)
+            cur.execute(
+                """
+                SELECT 1 FROM commitment_fee_exceptions
+                WHERE user_id = %s AND granted_for_matchday = %s
+                """,
+                (user_id, current_matchday),
+            )
+            exception_active = cur.fetchone() is not None
+
+        result = _decide_eligibility(config, has_paid, current_matchday, exception_active)
+        return result, config["deadline"]
+
+
+def _decide_eligibility(config, has_paid, current_matchday=None, exception_active=False):
+    """
+    The eligibility rules themselves, with every input already fetched --
+    shared by the single-user check and the roster-wide view so the two
+    can never disagree.
+    """
+    if config is None:
+        return {
+            "eligible": True,
+            "reason": "No commitment fee configured",
+            "has_paid": None,
+            "deadline_passed": False,
+            "exception_active": False,
+            "matchdays_since_deadline": None,
+        }
 
-        current_matchday = _current_matchday(cur)
-        matchdays_since_deadline = (
-            current_matchday - config["deadline_matchday"]
-            if config["deadline_matchday"] is not None
-            else 0
-        )
+    deadline_passed = _now() >= config["deadline"]
 
-        cur.execute(
-            """
-            SELECT 1 FROM commitment_fee_exceptions
-            WHERE user_id = %s AND granted_for_matchday = %s
-            """,
-            (user_id, current_matchday),
-        )
-        exception_active = cur.fetchone() is not None
-
-        if exception_active:
-            return {
-                "eligible": True,
-                "reason": "Treasurer exception active for this matchday",
-                "has_paid": False,
-                "deadline_passed": True,
-                "exception_active": True,
-                "matchdays_since_deadline": matchdays_since_deadline,
-            }
+    if has_paid:
+        return {
+            "eligible": True,
+            "reason": "Paid",
+            "has_paid": True,
+            "deadline_passed": deadline_passed,
+            "exception_active": False,
+            "matchdays_since_deadline": None,
+        }
 
+    if not deadline_passed:
         return {
-            "eligible": False,
-            "reason": "Unpaid and past deadline -- ask the Treasurer for an exception",
+            "eligible": True,
+            "reason": "Grace period -- before deadline",
             "has_paid": False,
-            "deadline_passed": True,
+            "deadline_passed": False,
             "exception_active": False,
+            "matchdays_since_deadline": None,
+        }
+
+    matchdays_since_deadline = (
+        (current_matchday or 0) - config["deadline_matchday"]
+        if config["deadline_matchday"] is not None
+        else 0
+    )
+
+    if exception_active:
+        return {
+            "eligible": True,
+            "reason": "Treasurer exception active for this matchday",
+            "has_paid": False,
+            "deadline_passed": True,
+            "exception_active": True,
             "matchdays_since_deadline": matchdays_since_deadline,
         }
+
+    return {
+        "eligible": False,
+        "reason": "Unpaid and past deadline -- ask the Treasurer for an exception",
+        "has_paid": False,
+        "deadline_passed": True,
+        "exception_active": False,
+        "matchdays_since_deadline": matchdays_since_deadline,
+    }
+
+
+def get_roster_eligibility():
+    """
+    Eligibility for every approved member at once, for the Treasurer's
+    dashboard: one joined query over users / fee status / this matchday's
+    exceptions instead of one get_user_eligibility() per member. Each row
+    is the payment-status fields plus the same dict get_user_eligibility
+    returns.
+    """
+    conn = get_db()
+    with conn.cursor() as cur:
+        config = _get_active_config(cur)
+        config = _ensure_deadline_matchday_captured(cur, config)
+        conn.commit()
+
+        cur.execute(
+            """
+            WITH tracker AS (
+                SELECT COALESCE(
+                    (SELECT current_matchday FROM matchday_tracker WHERE id = 1), 0
+                ) AS current_matchday
+            )
+            SELECT u.id, u.username, u.full_name,
+                   COALESCE(s.has_paid, FALSE) AS has_paid,
+                   s.confirmed_at,
+                   t.current_matchday,
+                   EXISTS (
+                       SELECT 1 FROM commitment_fee_exceptions e
+                       WHERE e.user_id = u.id
+                         AND e.granted_for_matchday = t.current_matchday
+                   ) AS exception_active
+            FROM users u
+            CROSS JOIN tracker t
+            LEFT JOIN commitment_fee_status s ON s.user_id = u.id
+            WHERE u.is_approved = 1
+            ORDER BY u.username
+            """
+        )
+        rows = cur.fetchall()
+
+    roster = []
+    for r in rows:
+        entry = {
+            "user_id": r["id"],
+            "username": r["username"],
+            "full_name": r["full_name"],
+            "confirmed_at": r["confirmed_at"],
+        }
+        entry.update(_decide_eligibility(
+            config, bool(r["has_paid"]), r["current_matchday"], r["exception_active"]
+        ))
+        roster.append(entry)
+    return roster
@@ -0,0 +1,45 @@
+"""
+Standalone background-job process:
+
+    python -m worker
+
+Runs the scheduled jobs defined in scheduler.py (fixture fetching, result
+collection/evaluation, savings rollover) in their own process, with their
+own small connection pool (WORKER_DB_POOL_MAX), so a slow BBC call or a
+big rollover never steals GIL time or pool connections from the web
+processes. Start web processes with RUN_SCHEDULER_IN_PROCESS=0 (or under
+gunicorn, which never starts the scheduler) so the jobs run only here.
+"""
+import os
+import sys
+import logging
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+load_dotenv()
+
+from db import configure_pools
+from app import create_app
+from scheduler import run_scheduler_blocking, SCHEDULED_JOB_COUNT, JOB_WORKER_THREADS
+
+logger = logging.getLogger(__name__)
+
+# One connection per job that can be running at once: the scheduled jobs
+# can all fire together, alongside up to JOB_WORKER_THREADS queue drains.
+# A smaller pool makes them queue on checkout and time out with PoolTimeout.
+WORKER_DB_POOL_MAX = int(
+    os.getenv("WORKER_DB_POOL_MAX", str(SCHEDULED_JOB_COUNT + JOB_WORKER_THREADS))
+)
+
+
+def main():
+    configure_pools(minconn=0, maxconn=WORKER_DB_POOL_MAX)
+    app = create_app()
+    logger.info("Background worker starting (pool max %d)", WORKER_DB_POOL_MAX)
+    run_scheduler_blocking(app)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())